@@ -1,14 +1,14 @@
 """The Riot LoL integration."""
+import asyncio
 import logging
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
-from .coordinator import RiotLoLDataUpdateCoordinator
+from .const import API_KEY, API_KEY_ENTRY_ID, API_KEY_UPDATE_TIME, DOMAIN, DEFAULT_SCAN_INTERVAL
+from .coordinator import RiotLoLDataUpdateCoordinator, async_close_riot_session, get_summoner_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,8 +22,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     config_type = entry.data.get("config_type", "summoner")
     
     if config_type == "api_key":
-        # This is just an API key configuration, no setup needed
+        # This is just an API key configuration, no platform setup needed.
+        # Remember the key and which entry holds it so lookups don't scan every entry.
         _LOGGER.debug("API key configuration entry, no platform setup required")
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        domain_data[API_KEY_ENTRY_ID] = entry.entry_id
+        domain_data[API_KEY] = entry.data.get("api_key")
+        domain_data[API_KEY_UPDATE_TIME] = entry.options.get("api_key_update_time")
+        # Refresh the summoners when the key is replaced in the options flow
+        entry.async_on_unload(entry.add_update_listener(async_update_options))
         return True
     
     # This is a summoner configuration
@@ -37,13 +44,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     update_interval = timedelta(seconds=scan_interval)
     
     # Create data update coordinator (no API key needed here, it gets it dynamically)
-    session = async_get_clientsession(hass)
+    # Coordinators share one pooled session tuned for the Riot API hosts
     coordinator = RiotLoLDataUpdateCoordinator(
         hass=hass,
         game_name=game_name,
         tag_line=tag_line,
         region=region,
-        session=session,
+        entry_id=entry.entry_id,
         update_interval=update_interval,
         puuid=puuid,  # Pass the pre-validated PUUID
     )
@@ -72,13 +79,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if config_type == "api_key":
         # API key configuration, no platforms to unload
+        domain_data = hass.data.get(DOMAIN, {})
+        if domain_data.get(API_KEY_ENTRY_ID) == entry.entry_id:
+            domain_data.pop(API_KEY_ENTRY_ID)
+            domain_data.pop(API_KEY, None)
+            domain_data.pop(API_KEY_UPDATE_TIME, None)
+            if not _has_coordinators(domain_data):
+                await async_close_riot_session(hass)
+            if not domain_data:
+                hass.data.pop(DOMAIN)
         return True
     
     # Summoner configuration, unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_will_remove_from_hass()
+        # Close the shared HTTP session with the last summoner
+        if not _has_coordinators(hass.data[DOMAIN]):
+            await async_close_riot_session(hass)
         
         # Remove domain data if no more entries
         if not hass.data[DOMAIN]:
@@ -87,6 +107,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted cache of a deleted summoner entry."""
+    if entry.data.get("config_type", "summoner") == "summoner":
+        await get_summoner_store(hass, entry.entry_id).async_remove()
+
+
+def _has_coordinators(domain_data: dict) -> bool:
+    """Check if any summoner coordinator is still loaded."""
+    return any(isinstance(value, RiotLoLDataUpdateCoordinator) for value in domain_data.values())
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update options for the config entry."""
     _LOGGER.debug("Updating options for Riot LoL entry: %s", entry.entry_id)
@@ -94,13 +125,30 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     config_type = entry.data.get("config_type", "summoner")
     
     if config_type == "api_key":
+        # The update time only moves when the key itself was replaced, so toggling the
+        # notification options doesn't refresh every summoner
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        domain_data[API_KEY] = entry.data.get("api_key")
+        update_time = entry.options.get("api_key_update_time")
+        if domain_data.get(API_KEY_UPDATE_TIME) == update_time:
+            return
+        domain_data[API_KEY_UPDATE_TIME] = update_time
+        
         # API key updated, trigger reload of all summoner coordinators
         _LOGGER.info("API key updated, triggering update for all summoner coordinators")
-        for domain_entry in hass.config_entries.async_entries(DOMAIN):
-            if (domain_entry.data.get("config_type") == "summoner" and 
-                domain_entry.entry_id in hass.data.get(DOMAIN, {})):
-                coordinator = hass.data[DOMAIN][domain_entry.entry_id]
-                await coordinator.async_request_refresh()
+        coordinators = [
+            domain_data[domain_entry.entry_id]
+            for domain_entry in hass.config_entries.async_entries(DOMAIN)
+            if domain_entry.data.get("config_type") == "summoner" and domain_entry.entry_id in domain_data
+        ]
+        # Refresh concurrently so each summoner's requests overlap on the pooled connections
+        results = await asyncio.gather(
+            *(coordinator.async_request_refresh() for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        for coordinator, result in zip(coordinators, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Refreshing %s after API key update failed: %s", coordinator.name, result)
         return
     
     # Summoner configuration options update
@@ -112,10 +160,9 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     
     # Update scan interval if changed
     new_scan_interval = entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
-    new_update_interval = timedelta(seconds=new_scan_interval)
     
-    if coordinator.update_interval != new_update_interval:
-        coordinator.update_interval = new_update_interval
+    if coordinator.update_interval is None or coordinator.update_interval.total_seconds() != new_scan_interval:
+        coordinator.update_interval = timedelta(seconds=new_scan_interval)
         _LOGGER.info("Updated scan interval to %s seconds", new_scan_interval)
 
 
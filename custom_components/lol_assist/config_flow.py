@@ -1,12 +1,28 @@
+import asyncio
+import hashlib
 import logging
-from urllib.parse import quote
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from urllib.parse import quote_from_bytes
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
-from homeassistant.core import callback
+from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
-from aiohttp import ClientSession, ClientResponseError, ClientTimeout
+from aiohttp import ClientError, ClientTimeout
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
 
 from .const import (
+    API_KEY,
+    API_KEY_ENTRY_ID,
     DOMAIN,
     PLATFORM_REGIONS,
     REGION_CLUSTERS,
@@ -15,12 +31,164 @@ from .const import (
     MAX_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
 )
+from .coordinator import _backoff_delay, _parse_retry_after, async_get_riot_semaphore, async_get_riot_session
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validation requests share the integration's pooled Riot session, with a per-request timeout
+_TIMEOUT = ClientTimeout(total=10)
+
+# API key check: look up a Riot ID that doesn't exist and judge the key by the status code.
+# The results are shared between calls, so they are read-only like the Riot ID errors below.
+_API_KEY_TEST_URL = "https://americas.api.riotgames.com/riot/account/v1/accounts/by-riot-id/test/user"
+_VALID_OK = MappingProxyType({"valid": True})
+_API_KEY_STATUS = MappingProxyType({
+    401: MappingProxyType({"valid": False, "error": "invalid_api_key"}),
+    403: MappingProxyType({"valid": False, "error": "forbidden_api_key"}),
+    404: _VALID_OK,  # Test user not found, the key itself was accepted
+    429: MappingProxyType({"valid": False, "error": "rate_limit"}),
+})
+
+# Rate limits and server errors are retried with the coordinator's jittered exponential backoff,
+# or after the Retry-After Riot sends, unless that is longer than a form should hang
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_MAX_ATTEMPTS = 4
+_MAX_RETRY_AFTER = 2  # seconds
+
+# ACCOUNT-V1 lives on the regional clusters; resolve each platform's Riot ID lookup prefix once
+_ACCOUNT_URL_PREFIX = {
+    region: f"https://{cluster}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/"
+    for region, cluster in REGION_CLUSTERS.items()
+}
+_ACCOUNT_URL_PREFIX_DEFAULT = "https://americas.api.riotgames.com/riot/account/v1/accounts/by-riot-id/"
+
+# Riot ID validation failures, shared read-only results keyed by account-v1 status
+_ERR_INVALID_KEY = MappingProxyType({"valid": False, "error_code": "invalid_api_key"})
+_ERR_KEY_EXPIRED = MappingProxyType({"valid": False, "error_code": "api_key_expired"})
+_ERR_ID_NOT_FOUND = MappingProxyType({"valid": False, "error_code": "riot_id_not_found"})
+_ERR_RATE_LIMIT = MappingProxyType({"valid": False, "error_code": "rate_limit"})
+_ERR_UNKNOWN = MappingProxyType({"valid": False, "error_code": "unknown_error"})
+_ERR_CONNECTION = MappingProxyType({"valid": False, "error_code": "connection_error"})
+_ERR_INVALID_RESPONSE = MappingProxyType({"valid": False, "error_code": "invalid_response"})
+_ERR_TAG_REQUIRED = MappingProxyType({"valid": False, "error_code": "tag_required"})
+# Failures worth re-checking in the background while the form is shown again
+_TRANSIENT_ERRORS = (_ERR_CONNECTION, _ERR_UNKNOWN)
+_VALIDATE_INPUT_STATUS = MappingProxyType({
+    401: _ERR_INVALID_KEY,
+    403: _ERR_KEY_EXPIRED,
+    404: _ERR_ID_NOT_FOUND,
+    429: _ERR_RATE_LIMIT,
+})
+
+# Form schemas that don't depend on existing entries are built once
+_SCAN_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+)
+_API_KEY_SCHEMA = vol.Schema({
+    vol.Required("api_key"): str,
+    vol.Optional("Key expiration notifications", default=True): bool,
+    vol.Optional("24-hour API key reminders", default=True): bool,
+})
+_SUMMONER_SCHEMA = vol.Schema({
+    vol.Required("game_name"): str,
+    vol.Required("tag_line"): str,
+    vol.Required("region", default=DEFAULT_REGION): vol.In(PLATFORM_REGIONS),
+    vol.Optional("scan_interval", default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_VALIDATOR,
+})
+
+# Recent API key verdicts (sha256 of the key -> (monotonic expiry, result)) so repeated
+# validations while editing options don't hit Riot again. Accepted keys are trusted longer
+# than rejected ones, which the user may be about to fix on the developer portal.
+_API_KEY_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_API_KEY_VALID_TTL = 300  # seconds
+_API_KEY_INVALID_TTL = 60  # seconds
+_API_KEY_CACHE_SIZE = 32
+
+# PUUIDs of Riot IDs that validated successfully, keyed by (API key hash, lowercased riot id,
+# regional cluster) -> (monotonic expiry, puuid), so resubmitting or re-adding a summoner doesn't
+# look the account up again. PUUIDs are encrypted per API key, so a rotated key misses the cache.
+# Entries expire because a renamed account frees its Riot ID.
+_PUUID_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_PUUID_CACHE_TTL = 300  # seconds
+_PUUID_CACHE_SIZE = 64
+
+
+async def _validate_api_key(hass: HomeAssistant, api_key: str) -> Mapping[str, Any]:
+    """Validate API key, reusing a recent verdict for the same key."""
+    key = hashlib.sha256(api_key.encode()).hexdigest()
+    entry = _API_KEY_CACHE.get(key)
+    if entry and time.monotonic() < entry[0]:
+        _API_KEY_CACHE.move_to_end(key)
+        return entry[1]
+
+    result = await _async_check_api_key(hass, api_key)
+    # Rate limits and connection errors say nothing about the key, so don't remember them
+    if result.get("error") not in ("rate_limit", "connection_error"):
+        ttl = _API_KEY_VALID_TTL if result["valid"] else _API_KEY_INVALID_TTL
+        _API_KEY_CACHE[key] = (time.monotonic() + ttl, result)
+        _API_KEY_CACHE.move_to_end(key)
+        if len(_API_KEY_CACHE) > _API_KEY_CACHE_SIZE:
+            _API_KEY_CACHE.popitem(last=False)
+    return result
+
+
+def _retry_delay(response, attempt: int) -> Optional[float]:
+    """Return how long to wait before retrying a response, or None if it shouldn't be retried."""
+    if response.status not in _RETRY_STATUSES or attempt >= _MAX_ATTEMPTS - 1:
+        return None
+    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is None:
+        return _backoff_delay(attempt, _MAX_RETRY_AFTER)
+    return retry_after if retry_after <= _MAX_RETRY_AFTER else None
+
+
+@lru_cache(maxsize=256)
+def _quote_segment(value: str) -> str:
+    """URL-quote a Riot ID path segment, skipping the common plain ASCII case."""
+    if value.isascii() and value.isalnum():
+        return value
+    return quote_from_bytes(value.encode(), safe='')
+
+
+def _api_key_options_schema(api_key: str, notifications: bool, reminders: bool) -> vol.Schema:
+    """Build the API key options schema with the current values as defaults."""
+    return vol.Schema({
+        vol.Required("api_key", default=api_key): str,
+        vol.Optional("Key expiration notifications", default=notifications): bool,
+        vol.Optional("24-hour API key reminders", default=reminders): bool,
+    })
+
+
+async def _async_check_api_key(hass: HomeAssistant, api_key: str) -> Mapping[str, Any]:
+    """Validate API key by making a test request."""
+    session = async_get_riot_session(hass)
+    semaphore = async_get_riot_semaphore(hass, "americas")
+    try:
+        for attempt in range(_MAX_ATTEMPTS):
+            async with semaphore, session.get(
+                _API_KEY_TEST_URL, headers={"X-Riot-Token": api_key}, timeout=_TIMEOUT
+            ) as response:
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    # Any other response means API key is probably valid
+                    return _API_KEY_STATUS.get(response.status, _VALID_OK)
+            _LOGGER.debug("API key check got status %s, retrying in %.2f seconds", response.status, delay)
+            await asyncio.sleep(delay)
+    except (ClientError, asyncio.TimeoutError) as err:
+        _LOGGER.error("Error validating API key: %s", err)
+        return {"valid": False, "error": "connection_error"}
+
+
 class RiotLoLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 2
 
+    def __init__(self):
+        """Initialize the config flow."""
+        self._api_key_entry_id = None
+        # Riot ID re-validation started when the form was re-shown after a transient error
+        self._prefetch_key = None
+        self._prefetch_task = None
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -30,17 +198,17 @@ class RiotLoLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(self, user_input=None):
         """Handle the initial setup - choose between API key setup or summoner setup."""
         # Check if we already have a global API key configuration
-        existing_api_config = None
-        for entry in self._async_current_entries():
-            if entry.data.get("config_type") == "api_key":
-                existing_api_config = entry
-                break
+        existing_api_config = next(
+            (entry for entry in self._async_current_entries() if entry.data.get("config_type") == "api_key"),
+            None,
+        )
 
         if existing_api_config is None:
             # No API key configured yet, must set up API key first
             return await self.async_step_api_key()
         else:
-            # API key exists, proceed to summoner setup
+            # API key exists, remember it and proceed to summoner setup
+            self._api_key_entry_id = existing_api_config.entry_id
             return await self.async_step_summoner()
 
     async def async_step_api_key(self, user_input=None):
@@ -53,10 +221,9 @@ class RiotLoLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             api_key_24h_type = user_input.get("24-hour API key reminders", True)
             
             # Validate API key by making a test request
-            validation_result = await self._validate_api_key(api_key)
+            validation_result = await _validate_api_key(self.hass, api_key)
             if validation_result["valid"]:
                 # Create API key configuration entry with update timestamp
-                from datetime import datetime
                 return self.async_create_entry(
                     title="Riot Games API Key",
                     data={
@@ -74,15 +241,9 @@ class RiotLoLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 errors["api_key"] = validation_result["error"]
 
-        data_schema = vol.Schema({
-            vol.Required("api_key"): str,
-            vol.Optional("Key expiration notifications", default=True): bool,
-            vol.Optional("24-hour API key reminders", default=True): bool,
-        })
-
         return self.async_show_form(
             step_id="api_key",
-            data_schema=data_schema,
+            data_schema=_API_KEY_SCHEMA,
             errors=errors,
             description_placeholders={
                 "api_url": "https://developer.riotgames.com/",
@@ -93,22 +254,38 @@ class RiotLoLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle summoner configuration (no API key needed)."""
         errors = {}
 
-        if user_input is not None:
+        if user_input is not None and not user_input["tag_line"]:
+            # Account-v1 can't find a Riot ID without its tag, don't spend a request on it
+            errors["tag_line"] = "tag_required"
+        elif user_input is not None:
             # Check if already configured
-            riot_id = f"{user_input['game_name']}#{user_input['tag_line']}" if user_input['tag_line'] else user_input['game_name']
+            riot_id = f"{user_input['game_name']}#{user_input['tag_line']}"
             await self.async_set_unique_id(f"{riot_id}_{user_input['region']}".lower())
             self._abort_if_unique_id_configured()
             
             game_name = user_input["game_name"]
-            tag_line = user_input["tag_line"] or ""
+            tag_line = user_input["tag_line"]
             region = user_input["region"]
 
             # Get API key from existing config
-            api_key = await self._get_global_api_key()
+            api_key = self._get_global_api_key()
             if not api_key:
                 return self.async_abort(reason="no_api_key")
 
-            validation_result = await self._validate_input(api_key, game_name, tag_line, region)
+            prefetch_key = (api_key, game_name, tag_line, region)
+            validation_result = None
+            if self._prefetch_task is not None and self._prefetch_key == prefetch_key:
+                # Same input resubmitted, the answer may already be in hand
+                validation_result = await self._prefetch_task
+                if validation_result in _TRANSIENT_ERRORS:
+                    validation_result = None
+            elif self._prefetch_task is not None:
+                # Different input, the early check's answer would be thrown away
+                self._prefetch_task.cancel()
+            self._prefetch_task = self._prefetch_key = None
+            if validation_result is None:
+                validation_result = await self._validate_input(api_key, game_name, tag_line, region)
+            
             if validation_result["valid"]:
                 # Store summoner data (no API key stored here)
                 data = {
@@ -123,136 +300,96 @@ class RiotLoLConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=riot_id, data=data)
             else:
                 errors["base"] = validation_result["error_code"]
+                if validation_result in _TRANSIENT_ERRORS:
+                    # Users usually resubmit the same Riot ID, start checking it again right away
+                    self._prefetch_key = prefetch_key
+                    self._prefetch_task = self.hass.async_create_background_task(
+                        self._validate_input(api_key, game_name, tag_line, region),
+                        name=f"{DOMAIN} Riot ID prefetch",
+                    )
 
-        data_schema = vol.Schema({
-            vol.Required("game_name"): str,
-            vol.Required("tag_line", default=""): str,
-            vol.Required("region", default=DEFAULT_REGION): vol.In(PLATFORM_REGIONS),
-            vol.Optional("scan_interval", default=DEFAULT_SCAN_INTERVAL): vol.All(
-                vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
-            ),
-        })
-        return self.async_show_form(step_id="summoner", data_schema=data_schema, errors=errors)
+        return self.async_show_form(step_id="summoner", data_schema=_SUMMONER_SCHEMA, errors=errors)
 
-    async def _get_global_api_key(self):
+    def _get_global_api_key(self):
         """Get the global API key from existing configuration."""
+        domain_data = self.hass.data.get(DOMAIN, {})
+        if domain_data.get(API_KEY):
+            return domain_data[API_KEY]
+        
+        entry_id = self._api_key_entry_id or domain_data.get(API_KEY_ENTRY_ID)
+        if entry_id:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                return entry.data.get("api_key")
+        
         for entry in self.hass.config_entries.async_entries(DOMAIN):
             if entry.data.get("config_type") == "api_key":
+                self._api_key_entry_id = entry.entry_id
                 return entry.data.get("api_key")
         return None
 
-    async def _validate_api_key(self, api_key):
-        """Validate API key by making a test request."""
-        url = "https://americas.api.riotgames.com/riot/account/v1/accounts/by-riot-id/test/user"
-        headers = {"X-Riot-Token": api_key}
-        
-        try:
-            timeout = ClientTimeout(total=10)
-            async with ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 401:
-                        return {"valid": False, "error": "invalid_api_key"}
-                    elif response.status == 403:
-                        return {"valid": False, "error": "forbidden_api_key"}
-                    elif response.status == 404:
-                        # 404 is expected for test user, means API key is valid
-                        return {"valid": True}
-                    elif response.status == 429:
-                        return {"valid": False, "error": "rate_limit"}
-                    else:
-                        # Any other response means API key is probably valid
-                        return {"valid": True}
-        except Exception as err:
-            _LOGGER.error("Error validating API key: %s", err)
-            return {"valid": False, "error": "connection_error"}
-
     async def _validate_input(self, api_key, game_name, tag_line, region):
         """Validate API key and Riot ID by fetching account info."""
+        if not tag_line:
+            return _ERR_TAG_REQUIRED
         
-        # Map platform regions to regional clusters for ACCOUNT-V1 API
-        regional_cluster = REGION_CLUSTERS.get(region, "americas")
+        cluster = REGION_CLUSTERS.get(region, "americas")
+        cache_key = (hashlib.sha256(api_key.encode()).hexdigest(), f"{game_name}#{tag_line}".lower(), cluster)
+        cached = _PUUID_CACHE.get(cache_key)
+        if cached and time.monotonic() < cached[0]:
+            _PUUID_CACHE.move_to_end(cache_key)
+            _LOGGER.debug("Riot ID %s#%s in region %s already validated", game_name, tag_line, region)
+            return {"valid": True, "error_code": None, "puuid": cached[1]}
         
         # URL encode the game name and tag line to handle special characters
-        encoded_game_name = quote(game_name, safe='')
-        encoded_tag_line = quote(tag_line, safe='') if tag_line else ""
+        encoded_game_name = _quote_segment(game_name)
+        encoded_tag_line = _quote_segment(tag_line)
         
         # Use ACCOUNT-V1 API to get PUUID by Riot ID (recommended approach)
-        url = f"https://{regional_cluster}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{encoded_game_name}/{encoded_tag_line}"
+        url_prefix = _ACCOUNT_URL_PREFIX.get(region, _ACCOUNT_URL_PREFIX_DEFAULT)
+        url = url_prefix + encoded_game_name + "/" + encoded_tag_line
         headers = {"X-Riot-Token": api_key}
         
-        _LOGGER.info(f"Validating Riot ID: {game_name}#{tag_line} in region {region}")
-        _LOGGER.info(f"Using regional cluster: {regional_cluster}")
-        _LOGGER.info(f"API URL (masked): https://{regional_cluster}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/***/***/")
+        _LOGGER.debug("Validating Riot ID: %s#%s in region %s", game_name, tag_line, region)
+        _LOGGER.debug("API URL (masked): %s***/***/", url_prefix)
         
-        timeout = ClientTimeout(total=10)  # 10 second timeout
-
         try:
-            async with ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers) as resp:
-                    _LOGGER.info(f"Account API response status: {resp.status}")
+            session = async_get_riot_session(self.hass)
+            semaphore = async_get_riot_semaphore(self.hass, cluster)
+            for attempt in range(_MAX_ATTEMPTS):
+                async with semaphore, session.get(url, headers=headers, timeout=_TIMEOUT) as resp:
+                    _LOGGER.debug("Account API response status: %s", resp.status)
                     if resp.status == 200:
-                        account_data = await resp.json()
-                        _LOGGER.info(f"Account API response data: {account_data}")
+                        account_data = await resp.json(loads=json_loads, content_type=None)
+                        _LOGGER.debug("Account API response data: %s", account_data)
                         puuid = account_data.get("puuid")
                         if puuid:
-                            _LOGGER.info(f"Successfully validated Riot ID: {game_name}#{tag_line} in region: {region}")
-                            return {"valid": True, "error_code": None, "puuid": puuid}
-                        else:
-                            _LOGGER.error(f"No PUUID found in response for {game_name}#{tag_line}")
-                            _LOGGER.error(f"Available fields in response: {list(account_data.keys()) if account_data else 'None'}")
-                            return {"valid": False, "error_code": "invalid_response"}
-                    elif resp.status == 401:
-                        _LOGGER.error(f"Invalid API key for region: {region}")
-                        return {"valid": False, "error_code": "invalid_api_key"}
-                    elif resp.status == 403:
-                        _LOGGER.error(f"API key expired or insufficient permissions for region: {region}")
-                        return {"valid": False, "error_code": "api_key_expired"}
-                    elif resp.status == 404:
-                        _LOGGER.error(f"Riot ID not found: {game_name}#{tag_line} in region: {region}")
-                        return {"valid": False, "error_code": "riot_id_not_found"}
-                    elif resp.status == 429:
-                        _LOGGER.error(f"Rate limit exceeded for region: {region}")
-                        return {"valid": False, "error_code": "rate_limit"}
-                    else:
-                        _LOGGER.error(f"Unexpected response status {resp.status} for {game_name}#{tag_line} in {region}")
-                        return {"valid": False, "error_code": "unknown_error"}
-                        
-        except ClientResponseError as e:
-            _LOGGER.error(f"HTTP error validating {game_name}#{tag_line}: {e}")
-            return {"valid": False, "error_code": "connection_error"}
-        except Exception as e:
-            _LOGGER.error(f"Unexpected error validating {game_name}#{tag_line}: {e}")
-            return {"valid": False, "error_code": "connection_error"}
-
-    async def _fallback_validate_summoner_name(self, api_key, summoner_name, region):
-        """Fallback validation using deprecated summoner name endpoint (for backward compatibility)."""
-        _LOGGER.warning("Using deprecated summoner name endpoint as fallback")
-        
-        # URL encode the summoner name to handle special characters
-        encoded_summoner_name = quote(summoner_name, safe='')
-        url = f"https://{region}.api.riotgames.com/lol/summoner/v4/summoners/by-name/{encoded_summoner_name}"
-        headers = {"X-Riot-Token": api_key}
-        
-        timeout = ClientTimeout(total=10)
-
-        try:
-            async with ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers) as resp:
-                    if resp.status == 200:
-                        summoner_data = await resp.json()
-                        puuid = summoner_data.get("puuid")
-                        if puuid:
-                            _LOGGER.info(f"Successfully validated summoner: {summoner_name} in region: {region}")
+                            _LOGGER.debug("Successfully validated Riot ID: %s#%s in region: %s", game_name, tag_line, region)
+                            _PUUID_CACHE[cache_key] = (time.monotonic() + _PUUID_CACHE_TTL, puuid)
+                            _PUUID_CACHE.move_to_end(cache_key)
+                            if len(_PUUID_CACHE) > _PUUID_CACHE_SIZE:
+                                _PUUID_CACHE.popitem(last=False)
                             return {"valid": True, "error_code": None, "puuid": puuid}
                         else:
-                            return {"valid": False, "error_code": "invalid_response"}
-                    elif resp.status == 404:
-                        return {"valid": False, "error_code": "summoner_not_found"}
+                            _LOGGER.error("No PUUID found in response for %s#%s", game_name, tag_line)
+                            _LOGGER.error("Available fields in response: %s", list(account_data) if account_data else None)
+                            return _ERR_INVALID_RESPONSE
                     else:
-                        return {"valid": False, "error_code": "connection_error"}
-        except Exception as e:
-            _LOGGER.error(f"Fallback validation failed for {summoner_name}: {e}")
-            return {"valid": False, "error_code": "connection_error"}
+                        delay = _retry_delay(resp, attempt)
+                        if delay is None:
+                            result = _VALIDATE_INPUT_STATUS.get(resp.status, _ERR_UNKNOWN)
+                            if resp.status in (401, 403, 404):
+                                _PUUID_CACHE.pop(cache_key, None)
+                            _LOGGER.error("Validating %s#%s in region %s failed with status %s (%s)",
+                                          game_name, tag_line, region, resp.status, result["error_code"])
+                            return result
+                _LOGGER.debug("Riot ID validation got status %s, retrying in %.2f seconds", resp.status, delay)
+                await asyncio.sleep(delay)
+                    
+        except (ClientError, asyncio.TimeoutError, ValueError) as e:
+            # ValueError covers a malformed JSON body
+            _LOGGER.error("Error validating %s#%s: %s", game_name, tag_line, e)
+            return _ERR_CONNECTION
 
 
 class RiotLoLOptionsFlow(config_entries.OptionsFlow):
@@ -260,8 +397,10 @@ class RiotLoLOptionsFlow(config_entries.OptionsFlow):
 
     def __init__(self, config_entry):
         """Initialize options flow."""
-        # Note: self.config_entry is automatically set by parent class
-        # No need to explicitly set it (deprecated in HA 2025.12)
+        # Home Assistant 2024.11+ sets self.config_entry itself (assigning it is deprecated there),
+        # older versions supported by this integration still need the assignment
+        if (MAJOR_VERSION, MINOR_VERSION) < (2024, 11):
+            self.config_entry = config_entry
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
@@ -280,62 +419,54 @@ class RiotLoLOptionsFlow(config_entries.OptionsFlow):
                 
                 if api_key_changed:
                     # Validate new API key only if it changed
-                    validation_result = await self._validate_api_key(new_api_key)
+                    validation_result = await _validate_api_key(self.hass, new_api_key)
                     if not validation_result["valid"]:
                         errors = {"api_key": validation_result["error"]}
                         current_notifications = self.config_entry.options.get("send_notifications") or self.config_entry.data.get("send_notifications", True)
                         current_24h = self.config_entry.options.get("api_key_24h_type") or self.config_entry.data.get("api_key_24h_type", True)
                         return self.async_show_form(
                             step_id="init",
-                            data_schema=vol.Schema({
-                                vol.Required("api_key", default=self.config_entry.data.get("api_key", "")): str,
-                                vol.Optional("Key expiration notifications", default=current_notifications): bool,
-                                vol.Optional("24-hour API key reminders", default=current_24h): bool,
-                            }),
+                            data_schema=_api_key_options_schema(
+                                self.config_entry.data.get("api_key", ""), current_notifications, current_24h
+                            ),
                             errors=errors
                         )
                 
                 # Update config entry - store in both data and options for persistence
-                from datetime import datetime
-                
                 if api_key_changed:
                     # Update both data and options with new timestamp
-                    new_data = self.config_entry.data.copy()
-                    new_data["api_key"] = new_api_key
-                    new_data["send_notifications"] = send_notifications
-                    new_data["api_key_24h_type"] = api_key_24h_type
+                    new_data = {
+                        **self.config_entry.data,
+                        "api_key": new_api_key,
+                        "send_notifications": send_notifications,
+                        "api_key_24h_type": api_key_24h_type,
+                    }
                     
                     new_options = {
                         "send_notifications": send_notifications,
                         "api_key_24h_type": api_key_24h_type,
                         "api_key_update_time": datetime.now().isoformat(),
                     }
-                    
-                    self.hass.config_entries.async_update_entry(
-                        self.config_entry, 
-                        data=new_data,
-                        options=new_options
-                    )
                 else:
                     # Only update notification settings, preserve existing api_key_update_time
-                    new_data = self.config_entry.data.copy()
-                    new_data["send_notifications"] = send_notifications
-                    new_data["api_key_24h_type"] = api_key_24h_type
-                    
-                    existing_options = self.config_entry.options.copy()
-                    final_options = {
+                    new_data = {
+                        **self.config_entry.data,
                         "send_notifications": send_notifications,
                         "api_key_24h_type": api_key_24h_type,
-                        "api_key_update_time": existing_options.get("api_key_update_time", datetime.now().isoformat()),
                     }
                     
-                    self.hass.config_entries.async_update_entry(
-                        self.config_entry, 
-                        data=new_data,
-                        options=final_options
-                    )
+                    new_options = {
+                        "send_notifications": send_notifications,
+                        "api_key_24h_type": api_key_24h_type,
+                        "api_key_update_time": self.config_entry.options.get("api_key_update_time", datetime.now().isoformat()),
+                    }
+                
+                # Home Assistant stores the options returned below and only notifies the update
+                # listener when they changed, so an unchanged save writes nothing
+                if new_data != self.config_entry.data:
+                    self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
                 
-                return self.async_create_entry(title="", data={})
+                return self.async_create_entry(title="", data=new_options)
 
             # Show form with current values - use fallback from data if options are empty
             current_entry = None
@@ -354,28 +485,24 @@ class RiotLoLOptionsFlow(config_entries.OptionsFlow):
             
             return self.async_show_form(
                 step_id="init",
-                data_schema=vol.Schema({
-                    vol.Required("api_key", default=self.config_entry.data.get("api_key", "")): str,
-                    vol.Optional("Key expiration notifications", default=current_notifications): bool,
-                    vol.Optional("24-hour API key reminders", default=current_24h): bool,
-                }),
+                data_schema=_api_key_options_schema(
+                    self.config_entry.data.get("api_key", ""), current_notifications, current_24h
+                ),
             )
         else:
             return await self.async_step_summoner_options(user_input)
 
     async def async_step_api_key_options(self, user_input=None):
         """Handle API key options."""
-        _LOGGER.error("=== API KEY OPTIONS STEP CALLED ===")
+        _LOGGER.debug("API key options step called")
         
         if user_input is not None:
-            _LOGGER.error("=== USER INPUT RECEIVED ===")
             # Extract values from user input with logging
             new_api_key = user_input["api_key"]
             send_notifications = user_input.get("Key expiration notifications", True)
             api_key_24h_type = user_input.get("24-hour API key reminders", True)
             
-            _LOGGER.error(f"User Input: {user_input}")
-            _LOGGER.error(f"Extracted - notifications: {send_notifications}, 24h: {api_key_24h_type}")
+            _LOGGER.debug("Options input - notifications: %s, 24h: %s", send_notifications, api_key_24h_type)
             
             # Check if API key has changed
             current_api_key = self.config_entry.data.get("api_key", "")
@@ -383,64 +510,50 @@ class RiotLoLOptionsFlow(config_entries.OptionsFlow):
             
             if api_key_changed:
                 # Validate new API key only if it changed
-                validation_result = await self._validate_api_key(new_api_key)
+                validation_result = await _validate_api_key(self.hass, new_api_key)
                 if not validation_result["valid"]:
                     errors = {"api_key": validation_result["error"]}
                     return self.async_show_form(
                         step_id="api_key_options",
-                        data_schema=vol.Schema({
-                            vol.Required("api_key", default=self.config_entry.data.get("api_key", "")): str,
-                            vol.Optional("Key expiration notifications", default=send_notifications): bool,
-                            vol.Optional("24-hour API key reminders", default=api_key_24h_type): bool,
-                        }),
+                        data_schema=_api_key_options_schema(
+                            self.config_entry.data.get("api_key", ""), send_notifications, api_key_24h_type
+                        ),
                         errors=errors
                     )
             
             # Update config entry - always update options, update data only if API key changed
-            from datetime import datetime
             new_options = {
                 "send_notifications": send_notifications,
                 "api_key_24h_type": api_key_24h_type,
             }
             
-            _LOGGER.error(f"Preparing to save options: {new_options}")
+            _LOGGER.debug("Preparing to save options: %s", new_options)
             
             if api_key_changed:
                 # Update both data and options with new timestamp
-                new_data = self.config_entry.data.copy()
-                new_data["api_key"] = new_api_key
+                new_data = {**self.config_entry.data, "api_key": new_api_key}
                 new_options["api_key_update_time"] = datetime.now().isoformat()  # Reset timer when key is updated
-                _LOGGER.error(f"API key changed - updating data and options")
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry, 
-                    data=new_data,
-                    options=new_options
-                )
+                _LOGGER.debug("API key changed - updating data and options")
+                self.hass.config_entries.async_update_entry(self.config_entry, data=new_data)
             else:
                 # Only update options, preserve existing api_key_update_time
-                existing_options = self.config_entry.options.copy()
-                existing_options.update(new_options)
-                _LOGGER.error(f"API key unchanged - updating only options: {existing_options}")
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry, 
-                    options=existing_options
-                )
+                new_options = {**self.config_entry.options, **new_options}
+                _LOGGER.debug("API key unchanged - updating only options: %s", new_options)
             
-            _LOGGER.error("=== OPTIONS UPDATE COMPLETED ===")
-            return self.async_create_entry(title="", data={})
+            # Home Assistant stores these as the entry options, skipping unchanged ones
+            _LOGGER.debug("API key options updated")
+            return self.async_create_entry(title="", data=new_options)
 
         # Show form with current values
         current_notifications = self.config_entry.options.get("send_notifications", True)
         current_24h = self.config_entry.options.get("api_key_24h_type", True)
-        _LOGGER.error(f"Showing form - current notifications: {current_notifications}, 24h: {current_24h}")
+        _LOGGER.debug("Showing form - current notifications: %s, 24h: %s", current_notifications, current_24h)
         
         return self.async_show_form(
             step_id="api_key_options",
-            data_schema=vol.Schema({
-                vol.Required("api_key", default=self.config_entry.data.get("api_key", "")): str,
-                vol.Optional("Key expiration notifications", default=current_notifications): bool,
-                vol.Optional("24-hour API key reminders", default=current_24h): bool,
-            }),
+            data_schema=_api_key_options_schema(
+                self.config_entry.data.get("api_key", ""), current_notifications, current_24h
+            ),
             description_placeholders={
                 "current_notifications": str(current_notifications),
                 "current_24h": str(current_24h),
@@ -458,31 +571,6 @@ class RiotLoLOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(
                     "scan_interval",
                     default=self.config_entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
-                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
+                ): _SCAN_INTERVAL_VALIDATOR,
             })
         )
-
-    async def _validate_api_key(self, api_key):
-        """Validate API key by making a test request."""
-        url = "https://americas.api.riotgames.com/riot/account/v1/accounts/by-riot-id/test/user"
-        headers = {"X-Riot-Token": api_key}
-        
-        try:
-            timeout = ClientTimeout(total=10)
-            async with ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 401:
-                        return {"valid": False, "error": "invalid_api_key"}
-                    elif response.status == 403:
-                        return {"valid": False, "error": "forbidden_api_key"}
-                    elif response.status == 404:
-                        # 404 is expected for test user, means API key is valid
-                        return {"valid": True}
-                    elif response.status == 429:
-                        return {"valid": False, "error": "rate_limit"}
-                    else:
-                        # Any other response means API key is probably valid
-                        return {"valid": True}
-        except Exception as err:
-            _LOGGER.error("Error validating API key: %s", err)
-            return {"valid": False, "error": "connection_error"}
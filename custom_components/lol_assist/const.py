@@ -3,9 +3,27 @@ Constants for LeagueAssistant - Unofficial League of Legends Integration.
 
 LeagueAssistant is not affiliated with Riot Games, Inc. or League of Legends.
 """
+from types import MappingProxyType
 
 DOMAIN = "lol_assist"
 
+# hass.data[DOMAIN] key holding the entry ID of the API key configuration
+API_KEY_ENTRY_ID = "_api_key_entry_id"
+# hass.data[DOMAIN] key holding the aiohttp session shared by all Riot API calls
+RIOT_SESSION = "_session"
+# hass.data[DOMAIN] key holding the callable removing that session's close-on-shutdown listener
+RIOT_SESSION_UNSUB = "_session_unsub"
+# hass.data[DOMAIN] key holding the per-host semaphores bounding concurrent Riot API requests
+RIOT_SEMAPHORES = "_semaphores"
+# hass.data[DOMAIN] key holding the per-host limiters keeping requests under Riot's application rate limits
+RIOT_RATE_LIMITERS = "_rate_limiters"
+# hass.data[DOMAIN] key holding the Riot API requests currently in flight, shared by all coordinators
+RIOT_INFLIGHT = "_inflight"
+# hass.data[DOMAIN] key holding the current API key value of that entry
+API_KEY = "_api_key"
+# hass.data[DOMAIN] key holding the last seen api_key_update_time of that entry
+API_KEY_UPDATE_TIME = "_api_key_update_time"
+
 # Configuration constants
 CONF_API_KEY = "api_key"
 CONF_GAME_NAME = "game_name"
@@ -20,7 +38,7 @@ MIN_SCAN_INTERVAL = 60       # 1 minute
 MAX_SCAN_INTERVAL = 3600     # 1 hour
 
 # API endpoints and regions (Updated 2025)
-REGION_CLUSTERS = {
+REGION_CLUSTERS = MappingProxyType({
     # Americas
     "na1": "americas",
     "br1": "americas", 
@@ -41,9 +59,9 @@ REGION_CLUSTERS = {
     "th2": "sea",      # Thailand
     "tw2": "sea",      # Taiwan
     "vn2": "sea"       # Vietnam
-}
+})
 
-PLATFORM_REGIONS = list(REGION_CLUSTERS.keys())
+PLATFORM_REGIONS = tuple(REGION_CLUSTERS)
 
 # Game states
 GAME_STATES = {
@@ -143,6 +161,16 @@ CHAMPION_NAMES = {
     901: "Smolder", 902: "Ambessa", 950: "Naafiri"
 }
 
+# Champion IDs are small integers, so names are also laid out in a tuple indexed by ID
+CHAMPION_NAMES_BY_ID = tuple(CHAMPION_NAMES.get(champion_id) for champion_id in range(max(CHAMPION_NAMES) + 1))
+
+
+def get_champion_name(champion_id: int) -> str:
+    """Return the champion name for an ID, or a Champion_<id> placeholder if it's unknown."""
+    if 0 <= champion_id < len(CHAMPION_NAMES_BY_ID) and CHAMPION_NAMES_BY_ID[champion_id]:
+        return CHAMPION_NAMES_BY_ID[champion_id]
+    return f"Champion_{champion_id}"
+
 # Sensor types
 SENSOR_TYPES = [
     "game_state",
@@ -5,20 +5,130 @@ LeagueAssistant is not affiliated with Riot Games, Inc. or League of Legends.
 This is an independent, community-created integration that uses the public Riot Games API.
 """
 import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-from urllib.parse import quote
+import random
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
-from aiohttp import ClientSession, ClientResponseError, ClientTimeout
-from homeassistant.core import HomeAssistant
+from aiohttp import ClientError, ClientSession, ClientResponseError, ClientTimeout, TCPConnector
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from yarl import URL
 
-from .const import REGION_CLUSTERS, GAME_STATES, DEFAULT_SCAN_INTERVAL, QUEUE_TYPES, GAME_MODES, CHAMPION_NAMES, MAP_NAMES, GAME_TYPES
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
+
+from .const import API_KEY, API_KEY_ENTRY_ID, DOMAIN, RIOT_INFLIGHT, RIOT_RATE_LIMITERS, RIOT_SEMAPHORES, RIOT_SESSION, RIOT_SESSION_UNSUB, REGION_CLUSTERS, GAME_STATES, DEFAULT_SCAN_INTERVAL, QUEUE_TYPES, GAME_MODES, MAP_NAMES, GAME_TYPES, get_champion_name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Resolved display states (fall back to literals if const.py loses a key)
+_STATE_IN_GAME = GAME_STATES.get("in_game", "In Game")
+_STATE_RECENTLY_PLAYED = GAME_STATES.get("recently_played", "Played Recently")
+_STATE_TOUCHING_GRASS = GAME_STATES.get("touching_grass", "Touching Grass")
+_STATE_UNKNOWN = GAME_STATES.get("unknown", "Unknown")
+
+# Player status (from recent activity) to display state
+_PLAYER_STATUS_STATES = {
+    "recently_played": _STATE_RECENTLY_PLAYED,
+    "touching_grass": _STATE_TOUCHING_GRASS,
+    "in_game": _STATE_IN_GAME,  # Backup mapping
+}
+
+# Riot API endpoint paths (appended to the platform or regional base URL)
+_ACCOUNT_PATH = "/riot/account/v1/accounts/by-riot-id"
+_SUMMONER_PATH = "/lol/summoner/v4/summoners/by-puuid/"
+_SPECTATOR_PATH = "/lol/spectator/v5/active-games/by-summoner/"
+_LEAGUE_PATH = "/lol/league/v4/entries/by-puuid/"
+_MATCH_IDS_PATH = "/lol/match/v5/matches/by-puuid/"
+_MATCH_DETAIL_PATH = "/lol/match/v5/matches/"
+
+_SOLO_QUEUE = "RANKED_SOLO_5x5"
+_ITEM_KEYS = tuple(f"item{slot}" for slot in range(7))  # Item slots 0-6 of a match participant
+
+# Requests in flight at once per Riot API host across the config flow and all coordinators,
+# well under the development key's 20 requests per second (limits apply per routing value)
+_MAX_CONCURRENT_REQUESTS = 10
+
+# Application rate limits per routing value: (requests, window in seconds). These are the
+# development key limits, used until Riot reports the key's own in the X-App-Rate-Limit header
+_APP_RATE_LIMITS = ((20, 1), (100, 120))
+
+# Shared request timeouts (current game lookups get a little more headroom)
+_TIMEOUT = ClientTimeout(total=10)
+_CURRENT_GAME_TIMEOUT = ClientTimeout(total=15)
+
+# Retry policy for rate limited (429) and server error (5xx) responses
+_MAX_RETRIES = 3
+_BACKOFF_BASE = 1.0  # seconds
+_BACKOFF_CAP = 30.0  # seconds
+
+# Persistent cache of resolved account identifiers and processed matches
+_STORAGE_VERSION = 1
+_MATCH_CACHE_SIZE = 8
+
+# Ranked stats only change after a match, so serve them stale and refresh off the update path
+_RANKED_FRESH_TTL = 60  # seconds
+_RANKED_STALE_TTL = 300  # seconds
+
+# Summoner level also only moves after a match; a new latest match clears the cached one
+_SUMMONER_LEVEL_TTL = 3600  # seconds
+
+# Nothing in the match history or ranked stats changes while a match is being played
+_MIN_GAME_SECONDS = 15 * 60  # earliest surrender, used to estimate the remaining game time
+_MATCH_IDS_COOLDOWN = 180  # seconds, no new match can complete this soon after the last one
+
+# Delay before re-checking the current game when a player seems to have just left one
+_RECHECK_DELAY = 3  # seconds
+
+
+class RiotRateLimit(UpdateFailed):
+    """Error to indicate the Riot API rate limit was exceeded."""
+
+
+class RiotAuthError(UpdateFailed):
+    """Error to indicate the Riot API key is invalid or expired."""
+
+
+class RiotNotFound(UpdateFailed):
+    """Error to indicate the Riot ID could not be found."""
+
+
+def _hash_api_key(api_key: str) -> str:
+    """Return a digest identifying an API key without persisting the key itself."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as delay seconds or as an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(attempt: int, cap: float = _BACKOFF_CAP) -> float:
+    """Return the exponential backoff with full jitter before retrying an attempt."""
+    return min(cap, _BACKOFF_BASE * 2 ** attempt) * random.random()
+
 
 def format_game_duration(seconds: int) -> str:
     """Format game duration from seconds to human readable format."""
@@ -37,15 +147,137 @@ def format_game_duration(seconds: int) -> str:
 
 def format_game_start_time(epoch_ms: int) -> str:
     """Format game start time from epoch milliseconds to human readable format."""
+    # Only whole seconds are shown, and the start time is the same on every poll of a game
+    return _format_epoch_seconds(epoch_ms // 1000)
+
+
+@lru_cache(maxsize=64)
+def _format_epoch_seconds(timestamp: int) -> str:
+    """Format an epoch timestamp in seconds as local time."""
     try:
-        # Convert milliseconds to seconds
-        timestamp = epoch_ms / 1000
         dt = datetime.fromtimestamp(timestamp)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except (ValueError, OSError):
         return "Unknown"
 
 
+@callback
+def async_get_riot_session(hass: HomeAssistant) -> ClientSession:
+    """Return the pooled session shared by the config flow and every coordinator."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session = domain_data.get(RIOT_SESSION)
+    if session is None or session.closed:
+        # A small bounded pool: bursts of refreshes queue for a connection instead of
+        # stampeding Riot's rate limits, and keep-alive connections survive between polls
+        session = ClientSession(
+            connector=TCPConnector(
+                limit=8,
+                limit_per_host=4,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            ),
+            timeout=_TIMEOUT,
+        )
+        domain_data[RIOT_SESSION] = session
+        # Don't leave the listener of a session that was closed elsewhere behind
+        unsub = domain_data.pop(RIOT_SESSION_UNSUB, None)
+        if unsub is not None:
+            unsub()
+
+        async def _async_close_session(event: Event) -> None:
+            # The listener is removed once it fires, so it mustn't be unsubscribed again
+            hass.data.get(DOMAIN, {}).pop(RIOT_SESSION_UNSUB, None)
+            await session.close()
+
+        domain_data[RIOT_SESSION_UNSUB] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+        )
+    return session
+
+
+@callback
+def async_get_riot_semaphore(hass: HomeAssistant, routing: str) -> asyncio.Semaphore:
+    """Return the semaphore requests to a Riot API host (platform or regional cluster) must hold."""
+    semaphores = hass.data.setdefault(DOMAIN, {}).setdefault(RIOT_SEMAPHORES, {})
+    semaphore = semaphores.get(routing)
+    if semaphore is None:
+        semaphore = semaphores[routing] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return semaphore
+
+
+class RiotRateLimiter:
+    """Sliding window limiter keeping requests to one Riot API host under the application rate limits."""
+
+    def __init__(self, limits: Tuple[Tuple[int, float], ...] = _APP_RATE_LIMITS) -> None:
+        """Initialize the limiter with (requests, window seconds) pairs."""
+        self._windows = tuple((count, period, deque()) for count, period in limits)
+        self._limits_header: Optional[str] = None
+
+    def update_limits(self, header: Optional[str]) -> None:
+        """Adopt the limits of an X-App-Rate-Limit header such as "20:1,100:120"."""
+        if not header or header == self._limits_header:
+            return
+        try:
+            limits = tuple(
+                (int(count), float(period))
+                for count, period in (pair.split(":") for pair in header.split(","))
+            )
+        except ValueError:
+            _LOGGER.debug("Ignoring malformed X-App-Rate-Limit header: %s", header)
+            return
+        self._limits_header = header
+        # The longest window holds every request still counted, seed the new windows from it
+        sent = max((window[2] for window in self._windows), key=len)
+        now = time.monotonic()
+        self._windows = tuple(
+            (count, period, deque(timestamp for timestamp in sent if now - timestamp < period))
+            for count, period in limits
+        )
+
+    def reserve(self) -> float:
+        """Record a request if every window has room, otherwise return the seconds to wait."""
+        now = time.monotonic()
+        delay = 0.0
+        for count, period, sent in self._windows:
+            while sent and now - sent[0] >= period:
+                sent.popleft()
+            if len(sent) >= count:
+                delay = max(delay, sent[0] + period - now)
+        if delay == 0.0:
+            for _, _, sent in self._windows:
+                sent.append(now)
+        return delay
+
+
+@callback
+def async_get_riot_rate_limiter(hass: HomeAssistant, routing: str) -> RiotRateLimiter:
+    """Return the rate limiter for a Riot API host (platform or regional cluster)."""
+    limiters = hass.data.setdefault(DOMAIN, {}).setdefault(RIOT_RATE_LIMITERS, {})
+    limiter = limiters.get(routing)
+    if limiter is None:
+        limiter = limiters[routing] = RiotRateLimiter()
+    return limiter
+
+
+def get_summoner_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the persistent cache of a summoner config entry."""
+    return Store(hass, _STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+async def async_close_riot_session(hass: HomeAssistant) -> None:
+    """Close the shared Riot API session if one was opened."""
+    domain_data = hass.data.get(DOMAIN, {})
+    domain_data.pop(RIOT_SEMAPHORES, None)
+    domain_data.pop(RIOT_RATE_LIMITERS, None)
+    domain_data.pop(RIOT_INFLIGHT, None)
+    unsub = domain_data.pop(RIOT_SESSION_UNSUB, None)
+    if unsub is not None:
+        unsub()
+    session = domain_data.pop(RIOT_SESSION, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
 class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Riot LoL data."""
 
@@ -55,6 +287,7 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         game_name: str,
         tag_line: str,
         region: str,
+        entry_id: str,
         session: ClientSession = None,
         update_interval: timedelta = timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         puuid: Optional[str] = None,
@@ -64,15 +297,47 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         self._game_name = game_name
         self._tag_line = tag_line
         self._region = region
-        self._session = session or async_get_clientsession(hass)
+        # Resolve API hosts and path segments once; they only depend on the entry data
+        self._regional_cluster = REGION_CLUSTERS.get(region, "americas")
+        self._regional_base = f"https://{self._regional_cluster}.api.riotgames.com"
+        self._platform_base = f"https://{region}.api.riotgames.com"
+        # yarl encodes the Riot ID path segments once; aiohttp uses the URL without re-parsing it
+        account_url = URL(self._regional_base + _ACCOUNT_PATH) / game_name
+        self._account_url = account_url / tag_line if tag_line else account_url
+        # The integration's pooled session is closed when the last summoner is unloaded
+        self._session = session or async_get_riot_session(hass)
+        # A busy regional cluster shouldn't hold up requests to the platform host, or vice versa
+        self._regional_semaphore = async_get_riot_semaphore(hass, self._regional_cluster)
+        self._platform_semaphore = async_get_riot_semaphore(hass, region)
+        self._regional_rate_limiter = async_get_riot_rate_limiter(hass, self._regional_cluster)
+        self._platform_rate_limiter = async_get_riot_rate_limiter(hass, region)
         self._puuid: Optional[str] = puuid  # Use pre-validated PUUID if available
         self._summoner_id: Optional[str] = None
         self._last_match_id: Optional[str] = None
         self._last_match_data: Optional[Dict[str, Any]] = None
         self._match_history: Optional[list] = None
+        # Processed match details keyed by match ID (completed matches never change)
+        self._match_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._in_game_until: float = 0.0  # monotonic time until which a match is assumed in progress
+        self._current_game_data: Optional[Dict[str, Any]] = None  # last processed game the player is in
+        self._match_ids_cooldown_until: float = 0.0
+        self._summoner_level: int = 0
+        self._summoner_level_until: float = 0.0  # monotonic time until which the level is reused
+        self._ranked_cache: Dict[str, Any] = {}
+        self._ranked_cache_ts: float = 0.0
+        self._ranked_refresh_task: Optional[asyncio.Task] = None
+        self._recheck_task: Optional[asyncio.Task] = None
         self._last_successful_data: Optional[Dict[str, Any]] = None
         self._consecutive_errors = 0
         self._max_errors = 5
+        self._headers: Optional[Dict[str, str]] = None
+        # (URL, ETag sent) -> pending request, shared with every coordinator so summoners in the
+        # same match, or the same account tracked on two platforms, fetch it only once
+        self._inflight: Dict[Tuple[Union[str, URL], Optional[str]], asyncio.Future] = (
+            hass.data.setdefault(DOMAIN, {}).setdefault(RIOT_INFLIGHT, {})
+        )
+        self._etags: Dict[Union[str, URL], str] = {}  # URL -> ETag of the last 200 for conditional GETs
+        self._backoff_until: float = 0.0  # monotonic time until which Riot asked us to back off
         
         # Notification throttling and tracking
         self._last_notification_time: Optional[datetime] = None
@@ -84,6 +349,12 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         
         riot_id = f"{game_name}#{tag_line}" if tag_line else game_name
         
+        # PUUIDs are encrypted per API key, so remember which key resolved the cached one.
+        # Keyed on the config entry, Riot IDs differing only in accents or case are different players
+        self._store = get_summoner_store(hass, entry_id)
+        self._store_loaded = False
+        self._puuid_key_hash: Optional[str] = None
+        
         super().__init__(
             hass,
             _LOGGER,
@@ -91,30 +362,43 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
-    def _get_api_key(self) -> Optional[str]:
-        """Get the global API key from configuration."""
-        from .const import DOMAIN
+    def _get_api_key_entry(self):
+        """Get the global API key config entry."""
+        entry_id = self._hass.data.get(DOMAIN, {}).get(API_KEY_ENTRY_ID)
+        if entry_id:
+            entry = self._hass.config_entries.async_get_entry(entry_id)
+            if entry is not None:
+                return entry
+        
+        # The API key entry may not be set up yet, fall back to scanning the entries
         for entry in self._hass.config_entries.async_entries(DOMAIN):
             if entry.data.get("config_type") == "api_key":
-                return entry.data.get("api_key")
+                return entry
         return None
 
+    def _get_api_key(self) -> Optional[str]:
+        """Get the global API key from configuration."""
+        api_key = self._hass.data.get(DOMAIN, {}).get(API_KEY)
+        if api_key:
+            return api_key
+        
+        entry = self._get_api_key_entry()
+        return entry.data.get("api_key") if entry else None
+
     def _should_send_notifications(self) -> bool:
         """Check if notifications are enabled for API key issues."""
-        from .const import DOMAIN
-        for entry in self._hass.config_entries.async_entries(DOMAIN):
-            if entry.data.get("config_type") == "api_key":
-                # Try options first, then fallback to data
-                return entry.options.get("send_notifications") or entry.data.get("send_notifications", True)
+        entry = self._get_api_key_entry()
+        if entry:
+            # Try options first, then fallback to data
+            return entry.options.get("send_notifications") or entry.data.get("send_notifications", True)
         return True
 
     def _is_24h_api_key(self) -> bool:
         """Check if user has indicated they're using a 24-hour development API key."""
-        from .const import DOMAIN
-        for entry in self._hass.config_entries.async_entries(DOMAIN):
-            if entry.data.get("config_type") == "api_key":
-                # Try options first, then fallback to data
-                return entry.options.get("api_key_24h_type") or entry.data.get("api_key_24h_type", True)  # Default to True for safety
+        entry = self._get_api_key_entry()
+        if entry:
+            # Try options first, then fallback to data
+            return entry.options.get("api_key_24h_type") or entry.data.get("api_key_24h_type", True)  # Default to True for safety
         return True
 
     def _can_send_notification(self) -> bool:
@@ -125,14 +409,6 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         time_since_last = datetime.now() - self._last_notification_time
         return time_since_last >= self._notification_cooldown
 
-    def _can_send_24h_reminder(self) -> bool:
-        """Check if enough time has passed since last 24h reminder."""
-        if self._last_24h_reminder_time is None:
-            return True
-        
-        time_since_last = datetime.now() - self._last_24h_reminder_time
-        return time_since_last >= self._24h_reminder_cooldown
-
     async def _send_api_key_notification(self, message: str, title: str = "LeagueAssistant API Key Issue", is_24h_reminder: bool = False):
         """Send a notification about API key issues with throttling."""
         if not self._should_send_notifications():
@@ -170,24 +446,23 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _get_api_key_update_time(self) -> Optional[datetime]:
         """Get the timestamp when the API key was last updated."""
-        from .const import DOMAIN
-        for entry in self._hass.config_entries.async_entries(DOMAIN):
-            if entry.data.get("config_type") == "api_key":
-                # Try to get from options first (newer format)
-                update_time_str = entry.options.get("api_key_update_time")
-                if not update_time_str:
-                    # Fall back to data (compatibility)
-                    update_time_str = entry.data.get("api_key_update_time")
-                
-                if update_time_str:
-                    try:
-                        return datetime.fromisoformat(update_time_str)
-                    except ValueError:
-                        _LOGGER.warning("Invalid API key update time format: %s", update_time_str)
-                        return None
-                else:
-                    # No update time stored, consider it as just updated now (for existing installations)
-                    return datetime.now()
+        entry = self._get_api_key_entry()
+        if entry:
+            # Try to get from options first (newer format)
+            update_time_str = entry.options.get("api_key_update_time")
+            if not update_time_str:
+                # Fall back to data (compatibility)
+                update_time_str = entry.data.get("api_key_update_time")
+            
+            if update_time_str:
+                try:
+                    return datetime.fromisoformat(update_time_str)
+                except ValueError:
+                    _LOGGER.warning("Invalid API key update time format: %s", update_time_str)
+                    return None
+            else:
+                # No update time stored, consider it as just updated now (for existing installations)
+                return datetime.now()
         return None
 
     def _should_send_24h_reminder(self) -> bool:
@@ -257,7 +532,139 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         api_key = self._get_api_key()
         if not api_key:
             raise UpdateFailed("No API key available")
-        return {"X-Riot-Token": api_key}
+        # Only rebuild the headers when the API key has been rotated
+        if self._headers is None or self._headers["X-Riot-Token"] != api_key:
+            self._headers = {"X-Riot-Token": api_key}
+        return self._headers
+
+    async def _async_load_store(self, api_key_hash: str) -> None:
+        """Restore account identifiers resolved before the last restart."""
+        self._store_loaded = True
+        stored = await self._store.async_load()
+        if not stored:
+            # First run after the config flow, which resolved the PUUID with the current key
+            if self._puuid:
+                self._puuid_key_hash = api_key_hash
+            return
+        self._puuid = stored.get("puuid") or self._puuid
+        self._summoner_id = stored.get("summoner_id") or self._summoner_id
+        self._puuid_key_hash = stored.get("api_key_hash")
+        self._match_cache = OrderedDict(stored.get("matches", {}))
+        _LOGGER.debug("Restored cached account identifiers for %s", self._game_name)
+
+    async def _async_save_store(self) -> None:
+        """Persist resolved account identifiers so restarts can skip the lookups."""
+        await self._store.async_save({
+            "puuid": self._puuid,
+            "summoner_id": self._summoner_id,
+            "api_key_hash": self._puuid_key_hash,
+            "matches": self._match_cache,
+        })
+
+    async def _async_invalidate_store(self) -> None:
+        """Forget cached account identifiers so the next update resolves them again."""
+        self._puuid_key_hash = None
+        await self._store.async_remove()
+
+    async def _request(
+        self, url: Union[str, URL], timeout: ClientTimeout = _TIMEOUT, conditional: bool = False
+    ) -> Tuple[int, Any]:
+        """GET a Riot API URL, sharing the result with concurrent callers for the same URL."""
+        # Callers sending a different ETag expect a different answer, so they don't share
+        key = (url, self._etags.get(url) if conditional else None)
+        future = self._inflight.get(key)
+        if future is not None:
+            _LOGGER.debug("Joining in-flight Riot API request for %s", url)
+            try:
+                # Shield so a cancelled waiter doesn't cancel the request for everyone else
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The coordinator making the request went away mid-flight, make our own
+            return await self._request(url, timeout, conditional)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._request_with_retry(url, timeout, conditional)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()  # Mark as retrieved in case nobody joined
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _request_with_retry(
+        self, url: Union[str, URL], timeout: ClientTimeout, conditional: bool = False
+    ) -> Tuple[int, Any]:
+        """GET a Riot API URL, retrying rate limits and server errors with backoff.
+
+        Returns the final HTTP status and the decoded JSON body (None unless the status is 200).
+        Conditional requests send the last ETag seen for the URL and return 304 when unchanged.
+        """
+        if time.monotonic() < self._backoff_until:
+            _LOGGER.debug("Riot API rate limit backoff active, skipping request")
+            return 429, None
+
+        headers = self._get_headers()
+        if str(url).startswith(self._platform_base):
+            semaphore, rate_limiter = self._platform_semaphore, self._platform_rate_limiter
+        else:
+            semaphore, rate_limiter = self._regional_semaphore, self._regional_rate_limiter
+        etag = self._etags.get(url) if conditional else None
+        if etag:
+            headers = {**headers, "If-None-Match": etag}
+        for attempt in range(_MAX_RETRIES + 1):
+            # Wait for room under the application rate limits rather than collecting a 429,
+            # but give up on this update when the window is far from freeing up
+            delay = rate_limiter.reserve()
+            while delay:
+                if delay > _BACKOFF_CAP:
+                    _LOGGER.debug("Riot API application rate limit reached, skipping request")
+                    return 429, None
+                await asyncio.sleep(delay)
+                delay = rate_limiter.reserve()
+            
+            retry_after = None
+            try:
+                async with semaphore, self._session.get(url, headers=headers, timeout=timeout) as response:
+                    status = response.status
+                    rate_limiter.update_limits(response.headers.get("X-App-Rate-Limit"))
+                    if status == 200:
+                        if conditional:
+                            # A 200 without an ETag mustn't leave the previous body's one behind
+                            if "ETag" in response.headers:
+                                self._etags[url] = response.headers["ETag"]
+                            else:
+                                self._etags.pop(url, None)
+                        # Match payloads are large, decode them with orjson when available and
+                        # skip aiohttp's content type check (Riot always answers with JSON)
+                        return status, await response.json(loads=json_loads, content_type=None)
+                    if status != 429 and status < 500:
+                        return status, None
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            except (asyncio.TimeoutError, ClientError):
+                if attempt == _MAX_RETRIES:
+                    raise
+                status = None
+
+            # Don't stall the update cycle for long server-mandated waits, back off instead
+            if attempt == _MAX_RETRIES or (retry_after is not None and retry_after > _BACKOFF_CAP):
+                if status == 429:
+                    self._backoff_until = time.monotonic() + (retry_after or _BACKOFF_CAP)
+                return status, None
+
+            if retry_after is None:
+                retry_after = _backoff_delay(attempt)
+            _LOGGER.debug("Riot API request failed (status %s), retrying in %.1f seconds", status, retry_after)
+            await asyncio.sleep(retry_after)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from Riot API."""
@@ -272,38 +679,57 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         if not api_key:
             raise UpdateFailed("No API key configured. Please set up the Riot Games API key first.")
         
+        api_key_hash = _hash_api_key(api_key)
+        if not self._store_loaded:
+            await self._async_load_store(api_key_hash)
+        
+        # One timestamp for everything produced by this update
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        summoner_task = current_game_task = None
         try:
-            # Always refresh PUUID to ensure region consistency with current API key
-            # This handles cases where API key region context changes or PUUID was cached from wrong region
-            try:
-                _LOGGER.debug("Refreshing account info to ensure PUUID region consistency...")
-                await self._fetch_account_info()
-            except UpdateFailed as err:
-                _LOGGER.error("Failed to refresh account info: %s", err)
-                # If we have a cached PUUID, continue with warning, otherwise fail
-                if not self._puuid:
-                    raise
-                _LOGGER.warning("Using cached PUUID despite refresh failure: %s", self._puuid[:8] + "...")
+            # Riot ID -> PUUID mappings only change with the API key (PUUIDs are encrypted per key),
+            # so only refresh account info when we have no PUUID resolved with the current key
+            if not self._puuid or self._puuid_key_hash != api_key_hash:
+                try:
+                    _LOGGER.debug("Refreshing account info to ensure PUUID consistency with the API key...")
+                    await self._fetch_account_info()
+                    self._puuid_key_hash = api_key_hash
+                    self._summoner_level_until = 0.0
+                    await self._async_save_store()
+                except UpdateFailed as err:
+                    _LOGGER.error("Failed to refresh account info: %s", err)
+                    # If we have a cached PUUID, continue with warning, otherwise fail
+                    if not self._puuid:
+                        raise
+                    _LOGGER.warning("Using cached PUUID despite refresh failure: %.8s...", self._puuid)
             
             if not self._puuid:
                 raise UpdateFailed("No PUUID available after account refresh")
             
-            # Fetch match history and latest match data first
-            try:
-                _LOGGER.debug("Fetching match history...")
-                await self._fetch_match_history()
-            except Exception as err:
-                _LOGGER.warning("Error fetching match history: %s", err)
+            # Summoner-v4 only needs the PUUID, so start it now and let it run behind the other calls
+            summoner_task = self.hass.async_create_task(self._fetch_summoner_level())
+            # Spectator-v5 doesn't depend on match history or ranked stats either
+            current_game_task = self.hass.async_create_task(self._fetch_current_game())
+            
+            # Match history and ranked stats can't change while the player is still in a match
+            match_in_progress = time.monotonic() < self._in_game_until
+            if match_in_progress:
+                _LOGGER.debug("Match in progress, skipping match history and ranked stats")
+                ranked_stats = self._ranked_cache or {"rank": "Unknown"}
+            else:
+                ranked_stats = await self._fetch_match_history_and_ranked_stats()
             
             # Check player status and current game
             player_status = None
             current_game_data = None
             try:
-                _LOGGER.debug("Checking for current game first...")
-                current_game = await self._fetch_current_game()
+                _LOGGER.debug("Waiting for current game...")
+                current_game = await current_game_task
                 if current_game:
                     _LOGGER.info("Player is currently in League of Legends game - processing game data")
-                    current_game_data = await self._process_current_game(current_game)
+                    current_game_data = await self._process_current_game(current_game, now_iso)
+                    self._current_game_data = current_game_data
                     player_status = "in_game"
                     _LOGGER.info("Current game data processed successfully: state=%s, game_mode=%s, champion=%s", 
                                current_game_data.get("state"), 
@@ -311,46 +737,51 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
                                current_game_data.get("champion"))
                 else:
                     _LOGGER.debug("Player not in current game, checking recent activity...")
-                    player_status = await self._fetch_player_status()
+                    self._current_game_data = None
+                    if match_in_progress:
+                        # The match ended since the last update, catch up on what was skipped
+                        self._in_game_until = 0.0
+                        ranked_stats = await self._fetch_match_history_and_ranked_stats()
+                    player_status = self._fetch_player_status()
                     
                     # Double-check: If previous state was "In Game" and now it's "Played Recently",
-                    # wait a moment and check again to ensure the game actually ended
-                    if (hasattr(self, '_last_successful_data') and self._last_successful_data and 
-                        self._last_successful_data.get("state") == "In Game" and 
-                        player_status == "recently_played"):
-                        _LOGGER.info("Status changed from 'In Game' to 'Played Recently' - double-checking...")
-                        await asyncio.sleep(3)  # Wait 3 seconds
-                        double_check_game = await self._fetch_current_game()
-                        if double_check_game:
-                            _LOGGER.info("Double-check found player still in game - keeping 'In Game' status")
-                            current_game_data = await self._process_current_game(double_check_game)
-                            player_status = "in_game"
-                        else:
-                            _LOGGER.info("Double-check confirmed game ended - status is 'Played Recently'")
+                    # check again in a moment, a follow-up refresh restores "In Game" if it hadn't ended
+                    if (self._last_successful_data and 
+                        self._last_successful_data.get("state") == _STATE_IN_GAME and 
+                        player_status == "recently_played" and
+                        (self._recheck_task is None or self._recheck_task.done())):
+                        _LOGGER.info("Status changed from 'In Game' to 'Played Recently' - scheduling a double-check")
+                        self._recheck_task = self.hass.async_create_background_task(
+                            self._async_delayed_recheck(), name=f"{self.name} in game recheck"
+                        )
                     
                     _LOGGER.info("Player status: %s", player_status)
+            except RiotRateLimit as err:
+                # Throttled isn't "not in game": keep the previous state without spending
+                # more requests on match history or a recheck until Riot answers again
+                _LOGGER.warning("%s, keeping the previous game state", err)
+                if self._current_game_data:
+                    current_game_data = {**self._current_game_data, "last_updated": now_iso}
+                    player_status = "in_game"
+                else:
+                    player_status = self._fetch_player_status()
             except Exception as err:
                 _LOGGER.warning("Error checking player status: %s", err)
                 player_status = "unknown"
             
-            # Fetch ranked stats
-            ranked_stats = {}
-            try:
-                _LOGGER.debug("Fetching ranked stats...")
-                ranked_stats = await self._fetch_ranked_stats()
-            except Exception as err:
-                _LOGGER.warning("Error fetching ranked stats: %s", err)
-                ranked_stats = {"rank": "Unknown"}
+            if current_game_data:
+                remaining = _MIN_GAME_SECONDS - current_game_data.get("game_length", 0)
+                self._in_game_until = time.monotonic() + max(60, remaining)
             
-            # Fetch summoner level
-            _LOGGER.debug("Fetching summoner level...")
-            summoner_level = await self._fetch_summoner_level()
+            # Collect summoner level
+            _LOGGER.debug("Waiting for summoner level...")
+            summoner_level = await summoner_task
             
             self._consecutive_errors = 0  # Reset error counter on success
             
             # Build comprehensive data combining current game, latest match, and ranked stats
             _LOGGER.debug("Building comprehensive data...")
-            result = self._build_comprehensive_data(current_game_data, ranked_stats, summoner_level, player_status)
+            result = self._build_comprehensive_data(current_game_data, ranked_stats, summoner_level, now_iso, player_status)
             
             # Cache successful result
             self._last_successful_data = result.copy()
@@ -375,8 +806,8 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
                 )
                 # Return minimal data instead of failing completely
                 return {
-                    "state": GAME_STATES["offline"],
-                    "last_updated": datetime.now().isoformat(),
+                    "state": _STATE_UNKNOWN,
+                    "last_updated": now_iso,
                     "error": str(err),
                     "summoner_level": 0,
                     "rank": "Unknown",
@@ -389,66 +820,74 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
                 }
             
             # For fewer errors, return cached data if available or minimal data
-            if hasattr(self, '_last_successful_data') and self._last_successful_data:
+            if self._last_successful_data:
                 _LOGGER.warning("Returning cached data due to error")
                 return self._last_successful_data
             
             raise UpdateFailed(f"Error communicating with Riot API: {err}")
+        finally:
+            # Don't leave the background lookups running unowned if the update is cancelled
+            # (shutdown, entry unload) or fails before awaiting them
+            for task in (summoner_task, current_game_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _async_delayed_recheck(self) -> None:
+        """Refresh again shortly to confirm the player really left their game."""
+        await asyncio.sleep(_RECHECK_DELAY)
+        await self.async_request_refresh()
 
     async def _fetch_account_info(self) -> None:
         """Fetch account info using Riot ID and ensure PUUID consistency with device region."""
         # Always use the device's configured region for the regional cluster
         # This ensures PUUID is fetched from the correct region for this device
-        regional_cluster = REGION_CLUSTERS.get(self._region, "americas")
-        
-        encoded_game_name = quote(self._game_name, safe='')
-        encoded_tag_line = quote(self._tag_line, safe='') if self._tag_line else ""
-        
-        url = f"https://{regional_cluster}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{encoded_game_name}/{encoded_tag_line}"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
+        url = self._account_url
         
         _LOGGER.info("Fetching account info for %s#%s in device region %s (cluster: %s)", 
-                    self._game_name, self._tag_line, self._region, regional_cluster)
+                    self._game_name, self._tag_line, self._region, self._regional_cluster)
         _LOGGER.debug("Account API URL: %s", url)
         
         try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    data = await response.json()
+            status, data = await self._request(url)
+            if status == 200:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug("Account API response for %s#%s: %s", 
                                 self._game_name, self._tag_line, 
                                 {k: v[:8] + "..." if k == "puuid" and v else v for k, v in data.items()})
                     
-                    puuid = data.get("puuid")
-                    if puuid and len(puuid) > 0:
-                        # Always update PUUID from fresh fetch to ensure region consistency
-                        old_puuid = self._puuid
-                        self._puuid = puuid
-                        if old_puuid and old_puuid != puuid:
-                            _LOGGER.info("PUUID updated for region consistency: %s -> %s", 
-                                       old_puuid[:8] + "..." if old_puuid else "None", 
-                                       self._puuid[:8] + "...")
-                        else:
-                            _LOGGER.debug("Retrieved PUUID for region %s: %s", self._region, self._puuid[:8] + "...")
+                puuid = data.get("puuid")
+                if puuid and len(puuid) > 0:
+                    # Always update PUUID from fresh fetch to ensure region consistency
+                    old_puuid = self._puuid
+                    self._puuid = puuid
+                    if old_puuid and old_puuid != puuid:
+                        _LOGGER.info("PUUID updated for region consistency: %.8s... -> %.8s...",
+                                     old_puuid, self._puuid)
                     else:
-                        available_fields = list(data.keys()) if data else []
-                        _LOGGER.error("Account API response missing valid 'puuid' field. Available fields: %s", available_fields)
-                        raise UpdateFailed(f"No PUUID found in account response. Available fields: {available_fields}")
-                elif response.status == 429:
-                    raise UpdateFailed("Rate limit exceeded")
-                elif response.status == 401:
-                    # API key expired or invalid - send notification
-                    await self._send_api_key_notification(
-                        "Your Riot Games API key has expired or is invalid. Please update it in the LeagueAssistant integration settings.",
-                        "LeagueAssistant: API Key Expired"
-                    )
-                    raise UpdateFailed("Invalid or expired API key")
-                elif response.status == 404:
-                    raise UpdateFailed(f"Riot ID not found: {self._game_name}#{self._tag_line} in region {self._region}")
+                        _LOGGER.debug("Retrieved PUUID for region %s: %.8s...", self._region, self._puuid)
                 else:
-                    raise UpdateFailed(f"API error: {response.status}")
+                    available_fields = list(data.keys()) if data else []
+                    _LOGGER.error("Account API response missing valid 'puuid' field. Available fields: %s", available_fields)
+                    raise UpdateFailed(f"No PUUID found in account response. Available fields: {available_fields}")
+            elif status == 429:
+                raise RiotRateLimit("Rate limit exceeded")
+            elif status == 401:
+                # API key expired or invalid - send notification
+                await self._send_api_key_notification(
+                    "Your Riot Games API key has expired or is invalid. Please update it in the LeagueAssistant integration settings.",
+                    "LeagueAssistant: API Key Expired"
+                )
+                await self._async_invalidate_store()
+                raise RiotAuthError("Invalid or expired API key")
+            elif status == 404:
+                await self._async_invalidate_store()
+                raise RiotNotFound(f"Riot ID not found: {self._game_name}#{self._tag_line} in region {self._region}")
+            else:
+                raise UpdateFailed(f"API error: {status}")
                     
+        except UpdateFailed:
+            # Keep the typed errors raised above instead of wrapping them as unexpected
+            raise
         except ClientResponseError as err:
             raise UpdateFailed(f"HTTP error fetching account info: {err}")
         except KeyError as err:
@@ -456,192 +895,96 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as err:
             raise UpdateFailed(f"Unexpected error fetching account info: {err}")
 
-    async def _fetch_summoner_info(self) -> None:
-        """Fetch summoner info using PUUID."""
-        if not self._puuid:
-            await self._fetch_account_info()
-            
-        if not self._puuid or len(self._puuid) < 10:
-            raise UpdateFailed(f"Invalid PUUID: {self._puuid}. Cannot fetch summoner info.")
-            
-        url = f"https://{self._region}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{self._puuid}"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
-        
-        _LOGGER.info("Fetching summoner info for PUUID %s in region %s", self._puuid[:8] + "...", self._region)
-        _LOGGER.info("Summoner API URL: %s", url.replace(self._puuid, self._puuid[:8] + "..."))
-        
-        try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    _LOGGER.info("Full summoner API response for debugging: %s", data)
-                    
-                    # Check for summoner ID in response (primary approach)
-                    summoner_id = data.get("id")
-                    if summoner_id:
-                        self._summoner_id = summoner_id
-                        _LOGGER.info("Successfully retrieved summoner ID: %s", self._summoner_id)
-                    else:
-                        # Log available fields and try alternative approaches
-                        available_fields = list(data.keys()) if data else []
-                        _LOGGER.error("Summoner API response missing 'id' field. Available fields: %s", available_fields)
-                        _LOGGER.error("This might indicate an API issue or regional problem. Response: %s", data)
-                        
-                        # Try alternative field names that might contain the summoner ID
-                        alt_id = data.get("summonerId") or data.get("encryptedSummonerId")
-                        if alt_id:
-                            self._summoner_id = alt_id
-                            _LOGGER.info("Using alternative summoner ID field: %s", self._summoner_id)
-                        else:
-                            # Continue without summoner ID and use PUUID where possible
-                            _LOGGER.warning("No summoner ID available, will use PUUID where possible")
-                            _LOGGER.warning("Some features (current game, ranked stats) may not work")
-                            self._summoner_id = None
-                elif response.status == 404:
-                    _LOGGER.warning("Summoner not found for PUUID %s... in region %s", self._puuid[:8], self._region)
-                    # Don't fail completely, just continue without summoner ID
-                    self._summoner_id = None
-                    return
-                elif response.status == 429:
-                    _LOGGER.warning("Rate limit exceeded for summoner lookup")
-                    return
-                elif response.status == 401:
-                    # API key expired or invalid - send notification
-                    await self._send_api_key_notification(
-                        "Your Riot Games API key has expired or is invalid. Please update it in the LeagueAssistant integration settings.",
-                        "LeagueAssistant: API Key Expired"
-                    )
-                    _LOGGER.warning("Invalid API key for summoner lookup")
-                    return
-                else:
-                    _LOGGER.warning("API error fetching summoner: %s", response.status)
-                    return
-                    
-        except ClientResponseError as err:
-            _LOGGER.warning("HTTP error fetching summoner info: %s", err)
-        except KeyError as err:
-            _LOGGER.warning("Missing expected field in summoner response: %s", err)
-        except Exception as err:
-            _LOGGER.warning("Unexpected error fetching summoner info: %s", err)
-
     async def _fetch_current_game(self) -> Optional[Dict[str, Any]]:
-        """Check if player is currently in a game using PUUID (modern approach) with retry logic."""
+        """Check if player is currently in a game using PUUID (modern approach) with retry logic.
+
+        Raises RiotRateLimit when throttled, which says nothing about whether the player is in a game.
+        """
         if not self._puuid:
             _LOGGER.debug("No PUUID available, skipping current game check")
             return None
             
-        url = f"https://{self._region}.api.riotgames.com/lol/spectator/v5/active-games/by-summoner/{self._puuid}"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=15)  # Increased timeout
+        url = self._platform_base + _SPECTATOR_PATH + self._puuid
         
-        _LOGGER.debug("Checking current game with PUUID endpoint: %s", url.replace(self._puuid, self._puuid[:8] + "..."))
+        _LOGGER.debug("Checking current game with PUUID endpoint: %s%s%.8s...", self._platform_base, _SPECTATOR_PATH, self._puuid)
         
-        # Try with retry logic for temporary failures
-        max_retries = 2
-        for attempt in range(max_retries + 1):
-            try:
-                async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                    if response.status == 200:
-                        game_data = await response.json()
-                        _LOGGER.info("Player is currently in game (PUUID endpoint) - attempt %d", attempt + 1)
-                        return game_data
-                    elif response.status == 404:
-                        # Not in game - this is definitive
-                        _LOGGER.debug("Player is not currently in game (PUUID endpoint) - attempt %d", attempt + 1)
-                        return None
-                    elif response.status == 429:
-                        if attempt < max_retries:
-                            _LOGGER.warning("Rate limit exceeded for current game check, retrying in %d seconds...", (attempt + 1) * 2)
-                            await asyncio.sleep((attempt + 1) * 2)  # Progressive backoff
-                            continue
-                        else:
-                            _LOGGER.warning("Rate limit exceeded for current game check after %d attempts", max_retries + 1)
-                            return None
-                    elif response.status == 401:
-                        # API key expired or invalid - send notification
-                        await self._send_api_key_notification(
-                            "Your Riot Games API key has expired or is invalid. Please update it in the LeagueAssistant integration settings.",
-                            "LeagueAssistant: API Key Expired"
-                        )
-                        _LOGGER.warning("Invalid API key for current game check")
-                        return None
-                    else:
-                        if attempt < max_retries:
-                            _LOGGER.warning("Error checking current game (status %d), retrying...", response.status)
-                            await asyncio.sleep(1)
-                            continue
-                        else:
-                            _LOGGER.warning("Error checking current game after %d attempts: %s", max_retries + 1, response.status)
-                            return None
-                        
-            except asyncio.TimeoutError:
-                if attempt < max_retries:
-                    _LOGGER.warning("Timeout checking current game, retrying...")
-                    await asyncio.sleep(1)
-                    continue
-                else:
-                    _LOGGER.warning("Timeout checking current game after %d attempts", max_retries + 1)
-                    return None
-            except ClientResponseError as err:
-                if attempt < max_retries:
-                    _LOGGER.warning("HTTP error checking current game: %s, retrying...", err)
-                    await asyncio.sleep(1)
-                    continue
-                else:
-                    _LOGGER.warning("HTTP error checking current game after %d attempts: %s", max_retries + 1, err)
-                    return None
-            except Exception as err:
-                if attempt < max_retries:
-                    _LOGGER.warning("Unexpected error checking current game: %s, retrying...", err)
-                    await asyncio.sleep(1)
-                    continue
-                else:
-                    _LOGGER.warning("Unexpected error checking current game after %d attempts: %s", max_retries + 1, err)
-                    return None
+        # Rate limits, server errors and timeouts are retried with backoff by _request
+        try:
+            status, game_data = await self._request(url, timeout=_CURRENT_GAME_TIMEOUT)
+            if status == 200:
+                _LOGGER.info("Player is currently in game (PUUID endpoint)")
+                return game_data
+            elif status == 404:
+                # Not in game - this is definitive
+                _LOGGER.debug("Player is not currently in game (PUUID endpoint)")
+                return None
+            elif status == 429:
+                raise RiotRateLimit("Rate limit exceeded for current game check")
+            elif status == 401:
+                # API key expired or invalid - send notification
+                await self._send_api_key_notification(
+                    "Your Riot Games API key has expired or is invalid. Please update it in the LeagueAssistant integration settings.",
+                    "LeagueAssistant: API Key Expired"
+                )
+                _LOGGER.warning("Invalid API key for current game check")
+                return None
+            else:
+                _LOGGER.warning("Error checking current game: %s", status)
+                return None
+                
+        except RiotRateLimit:
+            raise
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Timeout checking current game after %d attempts", _MAX_RETRIES + 1)
+        except ClientResponseError as err:
+            _LOGGER.warning("HTTP error checking current game: %s", err)
+        except Exception as err:
+            _LOGGER.warning("Unexpected error checking current game: %s", err)
         
         return None
 
-    async def _process_current_game(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _process_current_game(self, game_data: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
         """Process current game data."""
         try:
             # Find the player in the participants
-            participant = None
             participants = game_data.get("participants", [])
-            _LOGGER.debug("Looking for player in %d participants", len(participants))
-            _LOGGER.debug("Searching for PUUID: %s, Summoner ID: %s, Game Name: %s", 
-                         self._puuid[:8] + "..." if self._puuid else "None",
-                         self._summoner_id or "None", 
-                         self._game_name)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Looking for player in %d participants", len(participants))
+                _LOGGER.debug("Searching for PUUID: %s, Summoner ID: %s, Game Name: %s", 
+                             self._puuid[:8] + "..." if self._puuid else "None",
+                             self._summoner_id or "None", 
+                             self._game_name)
             
-            # Primary search by PUUID (most reliable)
-            for p in participants:
-                if self._puuid and p.get("puuid") == self._puuid:
-                    participant = p
+            # Primary search by PUUID (most reliable), then by Summoner ID
+            participant = None
+            if self._puuid:
+                participant = next((p for p in participants if p.get("puuid") == self._puuid), None)
+                if participant:
                     _LOGGER.info("Found player by PUUID match")
-                    break
-                elif self._summoner_id and p.get("summonerId") == self._summoner_id:
-                    participant = p
+            if not participant and self._summoner_id:
+                participant = next((p for p in participants if p.get("summonerId") == self._summoner_id), None)
+                if participant:
                     _LOGGER.info("Found player by Summoner ID match")
-                    break
             
             if not participant:
                 # Try to find by summoner name as fallback
                 _LOGGER.debug("Primary match failed, trying summoner name fallback")
+                game_name = self._game_name.lower()
                 for i, p in enumerate(participants):
                     summoner_name = p.get("summonerName", "")
                     _LOGGER.debug("Participant %d: summonerName='%s', championId=%s", 
                                  i, summoner_name, p.get("championId"))
-                    if summoner_name.lower() == self._game_name.lower():
+                    if summoner_name.lower() == game_name:
                         participant = p
                         _LOGGER.info("Found player by summoner name match: %s", summoner_name)
                         break
             
             if not participant:
                 _LOGGER.error("Player not found in current game data")
-                _LOGGER.debug("Available participants: %s", 
-                             [{"summonerName": p.get("summonerName"), "puuid": p.get("puuid", "")[:8] + "..." if p.get("puuid") else "None"} 
-                              for p in participants])
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Available participants: %s", 
+                                 [{"summonerName": p.get("summonerName"), "puuid": p.get("puuid", "")[:8] + "..." if p.get("puuid") else "None"} 
+                                  for p in participants])
                 raise UpdateFailed("Player not found in current game data")
             
             # Get champion info
@@ -650,7 +993,7 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
             
             # If championName is not provided, try to get it from championId
             if not champion_name or champion_name == "Unknown":
-                champion_name = CHAMPION_NAMES.get(champion_id, f"Champion_{champion_id}")
+                champion_name = get_champion_name(champion_id)
                 _LOGGER.debug("Resolved champion name from ID %d: %s", champion_id, champion_name)
             
             _LOGGER.debug("Final champion info: ID=%d, Name='%s'", champion_id, champion_name)
@@ -677,7 +1020,7 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
                         game_mode_name, queue_id, queue_name, champion_name, champion_id, map_name, game_duration_formatted)
             
             return {
-                "state": GAME_STATES.get("in_game", "In Game"),
+                "state": _STATE_IN_GAME,
                 "game_mode": game_mode_name,
                 "queue_type": queue_name,
                 "queue_id": queue_id,
@@ -690,7 +1033,7 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
                 "game_start_time_formatted": game_start_time_formatted,  # Human readable
                 "game_length": game_length_seconds,  # Keep raw for calculations
                 "game_duration": game_duration_formatted,  # Human readable
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": now_iso,
                 "match_id": str(game_data.get("gameId", "")),
                 # Current game doesn't have kill/death stats, set defaults
                 "kills": 0,
@@ -702,107 +1045,46 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error processing current game data: %s", err)
             raise UpdateFailed(f"Failed to process current game: {err}")
 
-    async def _fetch_latest_match_data(self) -> Optional[Dict[str, Any]]:
-        """Fetch data from the latest match."""
-        if not self._puuid:
-            return None
-            
-        # Get regional cluster for match API
-        regional_cluster = REGION_CLUSTERS.get(self._region, "americas")
-        
-        # Get latest match ID
-        url = f"https://{regional_cluster}.api.riotgames.com/lol/match/v5/matches/by-puuid/{self._puuid}/ids?start=0&count=1"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
-        
-        try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status != 200:
-                    _LOGGER.warning("Error fetching match list: %s", response.status)
-                    return None
-                    
-                match_ids = await response.json()
-                if not match_ids:
-                    return None
-                
-                latest_match_id = match_ids[0]
-                
-                # Skip if same as last processed match
-                if latest_match_id == self._last_match_id:
-                    return None
-                
-                # Fetch match details
-                match_data = await self._fetch_match_details(latest_match_id, regional_cluster)
-                if match_data:
-                    self._last_match_id = latest_match_id
-                    return match_data
-                    
-        except ClientResponseError as err:
-            _LOGGER.warning("HTTP error fetching match data: %s", err)
-            
-        return None
+    async def _fetch_match_history_and_ranked_stats(self) -> Dict[str, Any]:
+        """Fetch match history and ranked stats concurrently, returning the ranked stats."""
+        _LOGGER.debug("Fetching match history and ranked stats...")
+        match_history_result, ranked_stats = await asyncio.gather(
+            self._fetch_match_history(),
+            self._get_ranked_stats(),
+            return_exceptions=True,
+        )
+        if isinstance(match_history_result, Exception):
+            _LOGGER.warning("Error fetching match history: %s", match_history_result)
+        if isinstance(ranked_stats, Exception):
+            _LOGGER.warning("Error fetching ranked stats: %s", ranked_stats)
+            ranked_stats = self._ranked_cache or {"rank": "Unknown"}
+        return ranked_stats
 
-    async def _fetch_match_details(self, match_id: str, regional_cluster: str) -> Optional[Dict[str, Any]]:
-        """Fetch detailed match information."""
-        url = f"https://{regional_cluster}.api.riotgames.com/lol/match/v5/matches/{match_id}"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
+    async def _get_ranked_stats(self) -> Dict[str, Any]:
+        """Get ranked stats, serving cached values while refreshing them in the background."""
+        age = time.monotonic() - self._ranked_cache_ts
+        if self._ranked_cache and age < _RANKED_STALE_TTL:
+            if age >= _RANKED_FRESH_TTL and (
+                self._ranked_refresh_task is None or self._ranked_refresh_task.done()
+            ):
+                _LOGGER.debug("Ranked stats are %.0fs old, refreshing in the background", age)
+                self._ranked_refresh_task = self.hass.async_create_background_task(
+                    self._fetch_ranked_stats(), name=f"{self.name} ranked stats refresh"
+                )
+            return self._ranked_cache
         
-        try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    match_data = await response.json()
-                    return self._process_match_data(match_data)
-                elif response.status == 401:
-                    # API key expired or invalid - send notification
-                    await self._send_api_key_notification(
-                        "Your Riot Games API key has expired or is invalid. Please update it in the LeagueAssistant integration settings.",
-                        "LeagueAssistant: API Key Expired"
-                    )
-                    _LOGGER.warning("Invalid API key for match details")
-                    return None
-                else:
-                    _LOGGER.warning("Error fetching match details: %s", response.status)
-                    return None
-                
-        except ClientResponseError as err:
-            _LOGGER.warning("HTTP error fetching match details: %s", err)
-            return None
+        ranked_stats = await self._fetch_ranked_stats()
+        if ranked_stats is not self._ranked_cache and self._ranked_cache:
+            # Refresh failed (rate limited, server error...), keep showing the last known stats
+            _LOGGER.debug("Ranked stats refresh failed, using cached values")
+            return self._ranked_cache
+        return ranked_stats
 
-    def _process_match_data(self, match_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process match data to extract player stats."""
-        # Find player's participant data
-        participant = None
-        for p in match_data["info"]["participants"]:
-            if p.get("puuid") == self._puuid:
-                participant = p
-                break
-        
-        if not participant:
-            raise UpdateFailed("Player not found in match data")
-        
-        kills = participant.get("kills", 0)
-        deaths = participant.get("deaths", 0)
-        assists = participant.get("assists", 0)
-        
-        # Calculate KDA ratio
-        kda = (kills + assists) / max(deaths, 1)  # Avoid division by zero
-        
-        return {
-            "state": GAME_STATES["online"],
-            "kills": kills,
-            "deaths": deaths,
-            "assists": assists,
-            "kda": round(kda, 2),
-            "champion": participant.get("championName", "Unknown"),
-            "champion_level": participant.get("champLevel", 0),
-            "game_mode": match_data["info"].get("gameMode", "Unknown"),
-            "queue_type": match_data["info"].get("queueId"),
-            "game_duration": match_data["info"].get("gameDuration", 0),
-            "win": participant.get("win", False),
-            "match_id": match_data["metadata"]["matchId"],
-            "last_updated": datetime.now().isoformat(),
-        }
+    def _cache_ranked_stats(self, ranked_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Remember a successfully fetched ranked stats result."""
+        self._ranked_cache = ranked_stats
+        self._ranked_cache_ts = time.monotonic()
+        return ranked_stats
 
     async def _fetch_ranked_stats(self) -> Dict[str, Any]:
         """Fetch ranked statistics using PUUID."""
@@ -811,49 +1093,47 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
             return {"rank": "Unknown - No PUUID"}
             
         # Use PUUID-based league endpoint (newer, more reliable)
-        url = f"https://{self._region}.api.riotgames.com/lol/league/v4/entries/by-puuid/{self._puuid}"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
+        url = self._platform_base + _LEAGUE_PATH + self._puuid
         
-        _LOGGER.info("Fetching ranked stats for PUUID %s in region %s", self._puuid[:8] + "...", self._region)
+        _LOGGER.info("Fetching ranked stats for PUUID %.8s... in region %s", self._puuid, self._region)
         
         try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    ranked_data = await response.json()
-                    _LOGGER.info("Ranked API response: %s", ranked_data)
+            status, ranked_data = await self._request(url, conditional=bool(self._ranked_cache))
+            if status == 200:
+                _LOGGER.info("Ranked API response: %s", ranked_data)
                     
-                    # Find Solo/Duo queue stats
-                    solo_queue = None
-                    for queue in ranked_data:
-                        if queue.get("queueType") == "RANKED_SOLO_5x5":
-                            solo_queue = queue
-                            break
+                # Find Solo/Duo queue stats
+                solo_queue = next((q for q in ranked_data if q["queueType"] == _SOLO_QUEUE), None)
                     
-                    if solo_queue:
-                        wins = solo_queue.get("wins", 0)
-                        losses = solo_queue.get("losses", 0)
-                        total_games = wins + losses
-                        win_rate = (wins / total_games * 100) if total_games > 0 else 0
+                if solo_queue:
+                    wins = solo_queue.get("wins", 0)
+                    losses = solo_queue.get("losses", 0)
+                    total_games = wins + losses
+                    win_rate = (wins / total_games * 100) if total_games > 0 else 0
                         
-                        return {
-                            "rank": f"{solo_queue.get('tier', 'Unranked')} {solo_queue.get('rank', '')}".strip(),
-                            "wins": wins,
-                            "losses": losses,
-                            "win_rate": round(win_rate, 1),
-                            "league_points": solo_queue.get("leaguePoints", 0),
-                        }
-                    else:
-                        return {"rank": "Unranked"}
-                elif response.status == 404:
-                    _LOGGER.info("No ranked data found (unranked player)")
-                    return {"rank": "Unranked"}
-                elif response.status == 429:
-                    _LOGGER.warning("Rate limit exceeded for ranked stats")
-                    return {"rank": "Rate Limited"}
+                    return self._cache_ranked_stats({
+                        "rank": f"{solo_queue.get('tier', 'Unranked')} {solo_queue.get('rank', '')}".strip(),
+                        "wins": wins,
+                        "losses": losses,
+                        "win_rate": round(win_rate, 1),
+                        "league_points": solo_queue.get("leaguePoints", 0),
+                    })
                 else:
-                    _LOGGER.warning("Error fetching ranked stats: %s", response.status)
-                    return {"rank": "Unknown"}
+                    return self._cache_ranked_stats({"rank": "Unranked"})
+            elif status == 304:
+                _LOGGER.debug("Ranked stats unchanged since last fetch")
+                return self._cache_ranked_stats(self._ranked_cache)
+            elif status == 404:
+                _LOGGER.info("No ranked data found (unranked player)")
+                # The cached ETag belongs to the last ranked body, a 304 against it mustn't confirm this
+                self._etags.pop(url, None)
+                return self._cache_ranked_stats({"rank": "Unranked"})
+            elif status == 429:
+                _LOGGER.warning("Rate limit exceeded for ranked stats")
+                return {"rank": "Rate Limited"}
+            else:
+                _LOGGER.warning("Error fetching ranked stats: %s", status)
+                return {"rank": "Unknown"}
                     
         except ClientResponseError as err:
             _LOGGER.warning("HTTP error fetching ranked stats: %s", err)
@@ -861,20 +1141,14 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.warning("Unexpected error fetching ranked stats: %s", err)
             return {"rank": "Unknown"}
-                    
-        except ClientResponseError as err:
-            _LOGGER.warning("HTTP error fetching ranked stats: %s", err)
-            
-        return {"rank": "Unknown"}
 
-    async def _fetch_player_status(self) -> str:
+    def _fetch_player_status(self) -> str:
         """Fetch player status based on recent activity (not including current game check)."""
         # Check recent activity from last match
         if self._last_match_data:
             last_match_timestamp = self._last_match_data.get("game_end_timestamp", 0)
             if last_match_timestamp > 0:
-                import time
-                current_time = int(time.time() * 1000)  # Convert to milliseconds
+                current_time = time.time_ns() // 1_000_000  # Convert to milliseconds
                 time_diff_hours = (current_time - last_match_timestamp) / (1000 * 60 * 60)  # Convert to hours
                 
                 if time_diff_hours <= 4:
@@ -914,63 +1188,80 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         if not self._puuid:
             _LOGGER.warning("No PUUID available, cannot fetch match history")
             return
-            
-        # Get regional cluster for match API
-        regional_cluster = REGION_CLUSTERS.get(self._region, "americas")
         
+        if time.monotonic() < self._match_ids_cooldown_until:
+            _LOGGER.debug("Latest match was just processed, skipping match history check")
+            return
+            
         # Get last 10 match IDs
-        url = f"https://{regional_cluster}.api.riotgames.com/lol/match/v5/matches/by-puuid/{self._puuid}/ids?start=0&count=10"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
+        url = self._regional_base + _MATCH_IDS_PATH + self._puuid + "/ids?start=0&count=10"
         
-        _LOGGER.info("Fetching match history for PUUID %s", self._puuid[:8] + "...")
+        _LOGGER.info("Fetching match history for PUUID %.8s...", self._puuid)
         
         try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    match_ids = await response.json()
-                    self._match_history = match_ids
-                    _LOGGER.info("Retrieved %d match IDs: %s", len(match_ids), match_ids[:3] if match_ids else [])
+            # Only revalidate once the latest listed match has been processed
+            up_to_date = bool(self._match_history) and self._match_history[0] == self._last_match_id
+            status, match_ids = await self._request(url, conditional=up_to_date)
+            if status == 200:
+                self._match_history = match_ids
+                _LOGGER.info("Retrieved %d match IDs: %s", len(match_ids), match_ids[:3] if match_ids else [])
                     
-                    # If we have matches, fetch detailed data for the latest one
-                    if match_ids and (not self._last_match_id or match_ids[0] != self._last_match_id):
-                        latest_match_id = match_ids[0]
-                        _LOGGER.info("Fetching detailed data for latest match: %s", latest_match_id)
+                # If we have matches, fetch detailed data for the latest one
+                if match_ids and (not self._last_match_id or match_ids[0] != self._last_match_id):
+                    latest_match_id = match_ids[0]
+                    _LOGGER.info("Fetching detailed data for latest match: %s", latest_match_id)
                         
-                        # Fetch detailed match data
-                        match_data = await self._fetch_match_details_full(latest_match_id, regional_cluster)
-                        if match_data:
-                            self._last_match_data = match_data
-                            self._last_match_id = latest_match_id
-                            _LOGGER.info("Updated latest match data for match: %s", latest_match_id)
+                    # Fetch detailed match data
+                    match_data = await self._fetch_match_details_full(latest_match_id)
+                    if match_data:
+                        self._last_match_data = match_data
+                        self._last_match_id = latest_match_id
+                        # Only a processed match starts the cooldown, a failed detail fetch retries next update
+                        self._match_ids_cooldown_until = time.monotonic() + _MATCH_IDS_COOLDOWN
+                        # A finished game changes LP and can change the level, refresh both next time
+                        self._summoner_level_until = 0.0
+                        self._ranked_cache_ts = 0.0
+                        _LOGGER.info("Updated latest match data for match: %s", latest_match_id)
                         
-                elif response.status == 404:
-                    _LOGGER.warning("No match history found for player")
-                    self._match_history = []
-                elif response.status == 429:
-                    _LOGGER.warning("Rate limit exceeded for match history")
-                else:
-                    _LOGGER.warning("Error fetching match history: %s", response.status)
+            elif status == 304:
+                _LOGGER.debug("Match history unchanged since last fetch")
+            elif status == 404:
+                _LOGGER.warning("No match history found for player")
+                self._match_history = []
+            elif status == 429:
+                _LOGGER.warning("Rate limit exceeded for match history")
+            else:
+                _LOGGER.warning("Error fetching match history: %s", status)
                     
         except ClientResponseError as err:
             _LOGGER.warning("HTTP error fetching match history: %s", err)
         except Exception as err:
             _LOGGER.warning("Unexpected error fetching match history: %s", err)
 
-    async def _fetch_match_details_full(self, match_id: str, regional_cluster: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_match_details_full(self, match_id: str) -> Optional[Dict[str, Any]]:
         """Fetch full detailed match information including all participant data."""
-        url = f"https://{regional_cluster}.api.riotgames.com/lol/match/v5/matches/{match_id}"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
+        cached = self._match_cache.get(match_id)
+        if cached is not None:
+            _LOGGER.debug("Using cached match details for %s", match_id)
+            self._match_cache.move_to_end(match_id)
+            return cached
+        
+        url = self._regional_base + _MATCH_DETAIL_PATH + match_id
         
         try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    match_data = await response.json()
-                    return self._process_full_match_data(match_data)
-                else:
-                    _LOGGER.warning("Error fetching full match details for %s: %s", match_id, response.status)
-                    return None
+            status, match_data = await self._request(url)
+            if status == 200:
+                processed = self._process_full_match_data(match_data)
+                if processed:
+                    self._match_cache[match_id] = processed
+                    self._match_cache.move_to_end(match_id)
+                    if len(self._match_cache) > _MATCH_CACHE_SIZE:
+                        self._match_cache.popitem(last=False)
+                    await self._async_save_store()
+                return processed
+            else:
+                _LOGGER.warning("Error fetching full match details for %s: %s", match_id, status)
+                return None
                     
         except ClientResponseError as err:
             _LOGGER.warning("HTTP error fetching full match details: %s", err)
@@ -981,21 +1272,23 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _process_full_match_data(self, match_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process full match data including all available information."""
-        # Find player's participant data
-        participant = None
-        for p in match_data["info"]["participants"]:
-            if p.get("puuid") == self._puuid:
-                participant = p
-                break
+        info = match_data.get("info", {})
+        metadata = match_data.get("metadata", {})
+        
+        # Find player's participant data; metadata lists the PUUIDs in participant order,
+        # so a single list search locates it without touching the participant dicts
+        participants = info.get("participants", [])
+        try:
+            participant = participants[metadata.get("participants", []).index(self._puuid)]
+        except (ValueError, IndexError):
+            participant = None
+        if participant is None or participant.get("puuid") != self._puuid:
+            participant = next((p for p in participants if p.get("puuid") == self._puuid), None)
         
         if not participant:
             _LOGGER.error("Player not found in match data")
             return {}
         
-        # Extract comprehensive match information
-        info = match_data.get("info", {})
-        metadata = match_data.get("metadata", {})
-        
         # Basic stats
         kills = participant.get("kills", 0)
         deaths = participant.get("deaths", 0)
@@ -1023,11 +1316,8 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         vision_score = participant.get("visionScore", 0)
         
         # Items (0-6 slots)
-        items = []
-        for i in range(7):  # Items 0-6
-            item_id = participant.get(f"item{i}", 0)
-            if item_id > 0:
-                items.append(item_id)
+        item_ids = (participant.get(key, 0) for key in _ITEM_KEYS)
+        items = [item_id for item_id in item_ids if item_id > 0]
         
         return {
             "match_id": metadata.get("matchId", "Unknown"),
@@ -1050,8 +1340,6 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
             "cs_total": cs_total,
             "vision_score": vision_score,
             "items": items,
-            "participant_data": participant,  # Full participant data for advanced use
-            "all_participants": info.get("participants", []),  # All players in the match
         }
 
     async def _fetch_summoner_level(self) -> int:
@@ -1059,33 +1347,46 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
         if not self._puuid:
             _LOGGER.warning("No PUUID available, cannot fetch summoner level")
             return 0
+        
+        if self._summoner_level and time.monotonic() < self._summoner_level_until:
+            _LOGGER.debug("Using cached summoner level: %d", self._summoner_level)
+            return self._summoner_level
             
-        url = f"https://{self._region}.api.riotgames.com/lol/summoner/v4/summoners/by-puuid/{self._puuid}"
-        headers = self._get_headers()
-        timeout = ClientTimeout(total=10)
+        url = self._platform_base + _SUMMONER_PATH + self._puuid
         
-        _LOGGER.info("Fetching summoner level for PUUID %s", self._puuid[:8] + "...")
+        _LOGGER.info("Fetching summoner level for PUUID %.8s...", self._puuid)
         
         try:
-            async with self._session.get(url, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    level = data.get("summonerLevel", 0)
-                    _LOGGER.info("Successfully fetched summoner level: %d", level)
-                    return level
-                else:
-                    _LOGGER.warning("Error fetching summoner level: %s", response.status)
-                    return 0
+            status, data = await self._request(url)
+            if status == 200:
+                level = data.get("summonerLevel", 0)
+                _LOGGER.info("Successfully fetched summoner level: %d", level)
+                self._summoner_level = level
+                self._summoner_level_until = time.monotonic() + _SUMMONER_LEVEL_TTL
+                # Same response carries the summoner ID used as a current game lookup fallback
+                summoner_id = data.get("id")
+                if summoner_id and summoner_id != self._summoner_id:
+                    self._summoner_id = summoner_id
+                    await self._async_save_store()
+                return level
+            elif status in (400, 404):
+                # Riot can't decrypt or find the PUUID, it was resolved with another key
+                _LOGGER.warning("Summoner lookup failed with status %s, resolving the PUUID again", status)
+                self._puuid_key_hash = None
+            else:
+                _LOGGER.warning("Error fetching summoner level: %s", status)
                     
         except Exception as err:
             _LOGGER.warning("Error fetching summoner level: %s", err)
-            return 0
+        
+        # Keep showing the last known level (0 if there is none) until a refresh succeeds
+        return self._summoner_level
 
-    def _build_comprehensive_data(self, current_game_data: Optional[Dict[str, Any]], ranked_stats: Dict[str, Any], summoner_level: int, player_status: str = "unknown") -> Dict[str, Any]:
+    def _build_comprehensive_data(self, current_game_data: Optional[Dict[str, Any]], ranked_stats: Dict[str, Any], summoner_level: int, now_iso: str, player_status: str = "unknown") -> Dict[str, Any]:
         """Build comprehensive data combining current game, latest match, and other stats."""
         # Start with base data
         data = {
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": now_iso,
             "summoner_level": summoner_level,
         }
         
@@ -1118,15 +1419,8 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
             # Not in League game - use player status to determine state
             _LOGGER.debug("Player is not in League game - status: %s", player_status)
             
-            # Map player status to our honest game states
-            state_map = {
-                "recently_played": GAME_STATES.get("recently_played", "Played Recently"),
-                "touching_grass": GAME_STATES.get("touching_grass", "Touching Grass"),
-                "in_game": GAME_STATES.get("in_game", "In Game"),  # Backup mapping
-            }
-            
             # Set the state based on our honest detection
-            data["state"] = state_map.get(player_status, GAME_STATES.get("touching_grass", "Touching Grass"))
+            data["state"] = _PLAYER_STATUS_STATES.get(player_status, _STATE_TOUCHING_GRASS)
             
             if self._last_match_data:
                 latest_match = self._last_match_data
@@ -1183,5 +1477,7 @@ class RiotLoLDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_will_remove_from_hass(self):
         """Clean up when removed from Home Assistant."""
-        if hasattr(self, '_session') and self._session and not self._session.closed:
-            await self._session.close()
+        if self._ranked_refresh_task and not self._ranked_refresh_task.done():
+            self._ranked_refresh_task.cancel()
+        if self._recheck_task and not self._recheck_task.done():
+            self._recheck_task.cancel()